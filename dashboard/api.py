@@ -0,0 +1,148 @@
+import argparse
+import json
+import logging
+import math
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from components import data, forecasting, kpis, tariff
+from utils import config
+from utils.cache import CACHE
+
+logger = logging.getLogger("texo.api")
+
+SECTIONS = ("status", "maintenance", "energy")
+
+
+def _plain(value):
+    # numpy scalars, frames and NaN into what json can write
+    if isinstance(value, dict):
+        return {str(k): _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if isinstance(value, pd.DataFrame):
+        return _plain(value.to_dict(orient="records"))
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def current_etag():
+    # Every frame the payload is built from contributes its version, so a
+    # refresh of any of them is a new validator. With a published snapshot
+    # these are mapped once per process; in local mode the first call builds
+    # the frames, and later calls are cache hits.
+    frames = (*data.load_data(), data.load_energy_intervals()[0])
+    return '"' + ".".join(str(data.data_version(df)) for df in frames) + '"'
+
+
+def _energy_section(energy_df):
+    readings, meters = data.load_energy_intervals()
+    costs = tariff.recent_cost_summary(readings, meters)
+    forecast = forecasting.energy_forecast(readings, meters)
+    # Savings and rate from the tariff, the figures the energy card shows
+    section = kpis.tariff_energy_kpis(energy_df, costs)
+    section["costs"] = costs
+    if forecast is not None:
+        section["forecast"] = {
+            "avg_daily_kwh": forecast["categories"]["forecast"][forecasting.FLEET].mean(),
+            "by_category": forecasting.category_summary(forecast),
+        }
+    return section
+
+
+def build_payload(section=None):
+    # The same cached KPIs the status cards and summary panels render
+    equipment_df, maintenance_df, energy_df = data.load_data()
+    builders = {
+        "status": lambda: kpis.status_kpis(equipment_df, maintenance_df, energy_df),
+        "maintenance": lambda: kpis.maintenance_kpis(maintenance_df),
+        "energy": lambda: _energy_section(energy_df),
+    }
+    names = SECTIONS if section is None else (section,)
+    payload = {name: builders[name]() for name in names}
+    payload["data_version"] = data.data_version(equipment_df)
+    return json.dumps(_plain(payload), allow_nan=False).encode()
+
+
+class KpiHandler(BaseHTTPRequestHandler):
+    server_version = "texo-kpi"
+
+    def _respond(self, send_body):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/healthz":
+            return self._send(HTTPStatus.OK, b'{"ok": true}', send_body=send_body)
+        # /kpis for every section, /kpis/<section> for one
+        section = path.removeprefix("/kpis").lstrip("/") or None
+        if not path.startswith("/kpis") or (section is not None and section not in SECTIONS):
+            return self._send(HTTPStatus.NOT_FOUND, b'{"error": "not found"}', send_body=send_body)
+
+        try:
+            etag = current_etag()
+            candidates = [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]
+            if etag in candidates or "*" in candidates:
+                return self._send(HTTPStatus.NOT_MODIFIED, etag=etag)
+            # One serialized body per section and version, shared by every poller
+            body = CACHE.get_or_compute(("api", section, etag), lambda: build_payload(section))
+        except Exception:
+            # Pollers get an answer rather than a dropped connection
+            logger.exception("failed to build %s", path)
+            return self._send(HTTPStatus.INTERNAL_SERVER_ERROR, b'{"error": "internal error"}', send_body=send_body)
+        return self._send(HTTPStatus.OK, body, etag=etag, send_body=send_body)
+
+    def _send(self, status, body=b"", etag=None, send_body=True):
+        self.send_response(status)
+        if etag is not None:
+            self.send_header("ETag", etag)
+            # Clients may keep the body but must revalidate before using it
+            self.send_header("Cache-Control", "no-cache")
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body and status != HTTPStatus.NOT_MODIFIED:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def make_server(host=None, port=None):
+    # Port 0 picks a free port; read it back from server.server_address
+    host = config.API_HOST if host is None else host
+    port = config.API_PORT if port is None else port
+    return ThreadingHTTPServer((host, port), KpiHandler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve dashboard KPIs as JSON with ETag revalidation")
+    parser.add_argument("--host", default=config.API_HOST)
+    parser.add_argument("--port", type=int, default=config.API_PORT)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    server = make_server(args.host, args.port)
+    logger.info("serving KPIs on http://%s:%d/kpis", *server.server_address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,53 +1,49 @@
+import logging
+import time
 import streamlit as st
-from components import data, status_cards, charts, summary_cards
+from components import debug_panel, exports
+from utils import coalesce, config, metrics
 from utils.style import apply_custom_style
 from datetime import datetime
 
+render_started = time.perf_counter()
+
 # Configure page and apply styles
 st.set_page_config(layout="wide")
 st.title("Daily Operations Dashboard")
 apply_custom_style()
 
-# Load data
-equipment_df, maintenance_df, energy_df = data.load_data()
-
-# Current status indicators
-st.subheader("Current Operational Status")
-status_cards.display_status_cards(equipment_df, maintenance_df, energy_df)
-
-# Equipment Uptime Trends
-st.markdown('<p class="section-title">Equipment Uptime Trends</p>', unsafe_allow_html=True)
-equipment_chart = charts.create_equipment_uptime_chart(equipment_df)
-st.plotly_chart(equipment_chart, use_container_width=True)
-
-# Maintenance Metrics
-st.markdown('<p class="section-title">Maintenance Operations</p>', unsafe_allow_html=True)
-col1, col2 = st.columns([2, 1])
-with col1:
-    maintenance_chart = charts.create_maintenance_chart(maintenance_df)
-    st.plotly_chart(maintenance_chart, use_container_width=True)
-with col2:
-    summary_cards.display_maintenance_summary(maintenance_df)
-
-# Energy Consumption
-st.markdown('<p class="section-title">Energy Consumption</p>', unsafe_allow_html=True)
-col1, col2 = st.columns([1, 1])
-with col1:
-    energy_chart = charts.create_energy_consumption_chart(energy_df)
-    st.plotly_chart(energy_chart, use_container_width=True)
-with col2:
-    gauge_chart = charts.create_energy_gauge(energy_df)
-    st.plotly_chart(gauge_chart, use_container_width=True)
-    summary_cards.display_energy_summary(energy_df)
-
-# Critical Alerts
-st.markdown('<p class="section-title">Critical Alerts & Action Items</p>', unsafe_allow_html=True)
-summary_cards.display_alerts_table()
-
-# Performance Summary
-st.markdown('<p class="section-title">Performance Summary</p>', unsafe_allow_html=True)
-summary_cards.display_performance_summary()
+# Each page imports and computes only what it renders, so a viewer pays for
+# the area they are looking at rather than the whole dashboard
+page = st.navigation([
+    st.Page("views/overview.py", title="Overview", default=True),
+    st.Page("views/equipment.py", title="Equipment"),
+    st.Page("views/maintenance.py", title="Maintenance"),
+    st.Page("views/energy.py", title="Energy"),
+    st.Page("views/alerts.py", title="Alerts"),
+])
+
+# Live mode re-runs only the trend chart fragments on a timer and appends new
+# readings to each session's figure instead of rebuilding it
+st.sidebar.toggle("Live trend charts", key="live_mode", help=f"Refresh trend charts every {config.LIVE_REFRESH_SECONDS}s")
+
+# Date range and sites for the download buttons on each page
+exports.display_export_filters()
+
+# Superseded reruns are dropped during the debounce window or at the next
+# checkpoint, and counted in the debug panel
+coalesce.run_page(page)
+
+# Render timing; the first render in a process shows whether warm-up paid off
+render_seconds = time.perf_counter() - render_started
+metrics.observe("render_seconds", render_seconds)
+metrics.observe(f"render_seconds.{page.url_path or 'overview'}", render_seconds)
+if metrics.set_once("time_to_first_render_s", round(render_seconds, 3)):
+    logging.getLogger("texo.app").info("time to first render: %.3fs", render_seconds)
+
+# Debug information (enable with ?debug=1 or TEXO_DEBUG=1)
+debug_panel.display_debug_panel()
 
 # Footer
 st.markdown("---")
-st.caption(f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')} | Data refreshes every 15 minutes")
\ No newline at end of file
+st.caption(f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')} | Data refreshes every 15 minutes")
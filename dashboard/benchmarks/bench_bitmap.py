@@ -0,0 +1,84 @@
+"""Filter time with bitmap indexes against boolean-mask scans.
+
+Run from the dashboard directory:
+
+    python -m benchmarks.bench_bitmap --rows 1000000 10000000
+
+Builds a work-order-style event table with site, asset type and status
+columns, then resolves a set of filter combinations two ways: ``isin`` masks
+over the full columns and a gather, as the exports did, and the bitmap index
+the dashboard builds once per data version. Each figure is the best of
+``--repeat`` runs over all combinations and includes gathering the rows.
+"""
+import argparse
+import itertools
+import time
+
+import numpy as np
+import pandas as pd
+
+from components import data
+from utils.bitmap import BitmapIndex
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def event_table(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    asset_ids = rng.integers(0, 5000, n_rows)
+    return pd.DataFrame({
+        "asset_id": asset_ids,
+        "site": data.asset_sites(asset_ids),
+        "asset_type": data.asset_types(asset_ids),
+        "status": np.asarray(data.ORDER_STATUSES)[(rng.random(n_rows) < 0.8).astype("int8")],
+        "timestamp": rng.integers(0, 10**18, n_rows),
+    })
+
+
+def combinations():
+    # One and two sites, one and two asset types, either status
+    sites = [[s] for s in data.SITES] + [list(p) for p in itertools.combinations(data.SITES, 2)]
+    types = [[t] for t in data.ASSET_TYPES[:2]] + [data.ASSET_TYPES[:2]]
+    statuses = [[s] for s in data.ORDER_STATUSES]
+    return [dict(site=s, asset_type=t, status=st) for s, t, st in itertools.product(sites, types, statuses)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    filters = combinations()
+    print(f"{'rows':>12}{'build ms':>10}{'index KB':>10}{'scan ms':>10}{'bitmap ms':>11}{'speedup':>9}")
+    for n in args.rows:
+        table = event_table(n)
+        started = time.perf_counter()
+        index = BitmapIndex({name: table[name].to_numpy() for name in ("site", "asset_type", "status")})
+        build = (time.perf_counter() - started) * 1000
+
+        def scan():
+            for f in filters:
+                mask = np.ones(n, dtype=bool)
+                for name, values in f.items():
+                    mask &= table[name].isin(values).to_numpy()
+                table[mask]
+
+        def bitmap():
+            for f in filters:
+                index.select(table, **f)
+
+        scan_ms, bitmap_ms = best_of(args.repeat, scan), best_of(args.repeat, bitmap)
+        print(f"{n:>12,}{build:>10.0f}{index.nbytes / 1024:>10,.0f}{scan_ms:>10.0f}{bitmap_ms:>11.0f}"
+              f"{scan_ms / bitmap_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Render time and delta count for status-card grids, per-card vs batched.
+
+Run from the dashboard directory:
+
+    python -m benchmarks.bench_cards --cards 4 500
+
+"per-card" is the previous layout: a row of st.columns with one markdown
+element per card, each built from an indented f-string. "grid" renders the
+same cards from the precompiled templates in components.cards as a single
+markdown element. Each script run goes through Streamlit's AppTest; deltas
+counts every element and layout block the run emits.
+"""
+import argparse
+import time
+
+from streamlit.testing.v1 import AppTest
+
+
+def per_card_script(n_cards):
+    import streamlit as st
+
+    def legacy_status_card(value, label, target, status_class):
+        return f"""
+    <div class="summary-card">
+        <div class="metric-value {status_class}">{value}</div>
+        <div class="metric-label">{label}</div>
+        <div style="text-align: center; margin-top: 10px;">
+            <small>Target: {target}</small>
+        </div>
+    </div>
+    """
+
+    for start in range(0, n_cards, 4):
+        columns = st.columns(4)
+        for i, col in zip(range(start, min(start + 4, n_cards)), columns):
+            with col:
+                st.markdown(legacy_status_card(90 + i % 10, f"Site {i} Uptime", ">95%", "normal"), unsafe_allow_html=True)
+
+
+def grid_script(n_cards):
+    from components import cards
+
+    cards.render_grid(
+        [cards.status_card(90 + i % 10, f"Site {i} Uptime", ">95%", "normal") for i in range(n_cards)],
+        columns=4,
+    )
+
+
+def count_deltas(node):
+    children = getattr(node, "children", {})
+    return 1 + sum(count_deltas(child) for child in children.values())
+
+
+def payload_bytes(node):
+    proto = getattr(node, "proto", None)
+    size = len(proto.SerializeToString()) if proto is not None else 0
+    return size + sum(payload_bytes(child) for child in getattr(node, "children", {}).values())
+
+
+def measure(script, n_cards, repeat):
+    timings = []
+    for _ in range(repeat):
+        at = AppTest.from_function(script, args=(n_cards,))
+        started = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - started)
+    main = at._tree.children[0]
+    return min(timings) * 1000, count_deltas(main) - 1, payload_bytes(main)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, nargs="+", default=[4, 500])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'cards':>6}  {'layout':<9}{'render ms':>11}{'deltas':>8}{'bytes':>10}")
+    for n_cards in args.cards:
+        for name, script in (("per-card", per_card_script), ("grid", grid_script)):
+            ms, deltas, size = measure(script, n_cards, args.repeat)
+            print(f"{n_cards:>6}  {name:<9}{ms:>11.1f}{deltas:>8,}{size:>10,}")
+
+
+if __name__ == "__main__":
+    main()
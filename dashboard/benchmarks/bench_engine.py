@@ -0,0 +1,71 @@
+"""Aggregation time on the pandas and polars engines across data sizes.
+
+Run from the dashboard directory:
+
+    python -m benchmarks.bench_engine --meters 100 1000 5000 --days 365
+
+Times the operations behind the charts and KPIs on synthetic 15-minute meter
+data: daily per-meter totals, per-category sums, and the full time-of-use
+cost rollup. Each figure is the best of ``--repeat`` runs and includes the
+conversion into and out of the engine.
+"""
+import argparse
+import time
+
+from components import data, tariff
+from utils import engine
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def operations(readings, meters):
+    groups = meters.set_index("meter_id")["category"].reindex(readings.columns).to_numpy()
+    return {
+        "daily sums": lambda name: engine.period_sums(readings, "D", name),
+        "hourly sums": lambda name: engine.period_sums(readings, "h", name),
+        "category sums": lambda name: engine.group_sums(readings, groups, name),
+        "cost rollup": lambda name: _with_engine(name, tariff.cost_rollup.uncached, readings, meters),
+    }
+
+
+def _with_engine(name, fn, *args):
+    previous, engine.ENGINE = engine.ENGINE, name
+    try:
+        return fn(*args)
+    finally:
+        engine.ENGINE = previous
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meters", type=int, nargs="+", default=[100, 1_000, 5_000])
+    parser.add_argument("--days", type=int, default=365, help="days of 15-minute readings")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if engine.pl is None:
+        parser.error("polars is not installed")
+
+    print(f"{'meters':>7}{'cells':>13}  {'operation':<15}{'pandas ms':>11}{'polars ms':>11}{'speedup':>9}")
+    base = sum(n for _, n in data.ENERGY_CATEGORIES.values())
+    for n_meters in args.meters:
+        categories = {name: (kwh, max(1, round(n * n_meters / base))) for name, (kwh, n) in data.ENERGY_CATEGORIES.items()}
+        readings, meters = data.generate_interval_energy(days=args.days, categories=categories)
+        for name, op in operations(readings, meters).items():
+            pandas_ms = best_of(args.repeat, lambda: op("pandas"))
+            polars_ms = best_of(args.repeat, lambda: op("polars"))
+            print(
+                f"{readings.shape[1]:>7,}{readings.size:>13,}  {name:<15}"
+                f"{pandas_ms:>11.1f}{polars_ms:>11.1f}{pandas_ms / polars_ms:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Batch forecast fitting time across fleet sizes and worker counts.
+
+Run from the dashboard directory:
+
+    python -m benchmarks.bench_forecast --series 100 2000 20000 --workers 1 2 4
+
+Fits the weekly Holt-Winters model behind the energy forecast on a synthetic
+days x series matrix of daily kWh. ``1`` worker fits the whole matrix in this
+process; more split its columns across a process pool, which is what
+``TEXO_FORECAST_WORKERS`` and ``TEXO_FORECAST_PROCESS_MIN_SERIES`` control in
+the dashboard. Each figure is the best of ``--repeat`` runs and includes
+starting the pool.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from components import forecasting
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def daily_matrix(days, n_series, seed=0):
+    rng = np.random.default_rng(seed)
+    weekday = (np.arange(days) % 7 < 5)[:, None]
+    base = rng.uniform(50, 500, n_series)[None, :]
+    return base * np.where(weekday, 1.2, 0.7) * rng.normal(1, 0.05, (days, n_series))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--horizon", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'series':>8}" + "".join(f"{f'{w} worker ms':>14}" for w in args.workers))
+    for n in args.series:
+        values = daily_matrix(args.days, n)
+        # The threshold is lifted so every worker count really uses the pool
+        forecasting.config.FORECAST_PROCESS_MIN_SERIES = 0
+        timings = [
+            best_of(args.repeat, lambda: forecasting.fit_all(values, args.horizon, workers=w))
+            for w in args.workers
+        ]
+        print(f"{n:>8}" + "".join(f"{ms:>14.0f}" for ms in timings))
+
+
+if __name__ == "__main__":
+    main()
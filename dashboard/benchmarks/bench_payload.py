@@ -0,0 +1,107 @@
+"""Figure payload size and client parse time, JSON text vs typed arrays.
+
+Run from the dashboard directory:
+
+    python -m benchmarks.bench_payload --lengths 100 1000 10000 100000
+
+Parse time is measured in Node (JSON.parse plus decoding every typed array,
+which is what plotly.js does in the browser) when ``node`` is on PATH, and
+in Python otherwise.
+"""
+import argparse
+import base64
+import json
+import shutil
+import subprocess
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from components import charts, data
+
+NODE_PARSE = r"""
+let input = "";
+process.stdin.on("data", d => input += d);
+process.stdin.on("end", () => {
+  const decode = v => {
+    if (v && typeof v === "object") {
+      if (typeof v.bdata === "string") return Buffer.from(v.bdata, "base64");
+      for (const k in v) v[k] = decode(v[k]);
+    }
+    return v;
+  };
+  const runs = 20;
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < runs; i++) decode(JSON.parse(input));
+  console.log(Number(process.hrtime.bigint() - start) / 1e6 / runs);
+});
+"""
+
+DTYPES = {"i1": np.int8, "u1": np.uint8, "i2": np.int16, "u2": np.uint16,
+          "i4": np.int32, "u4": np.uint32, "f4": np.float32, "f8": np.float64}
+
+
+def legacy_uptime_chart(equipment_df):
+    # The pre-typed-array builder: text dates and plain number lists
+    fig = go.Figure()
+    for column in ["Chillers", "Compressors", "Generators", "Production Line"]:
+        fig.add_trace(go.Scatter(x=list(equipment_df["Date"]), y=equipment_df[column].tolist(),
+                                 name=column, mode="lines+markers"))
+    return fig
+
+
+def legacy_energy_chart(energy_df):
+    fig = go.Figure()
+    for column in ["Chillers (kWh)", "Compressors (kWh)", "Lighting (kWh)"]:
+        fig.add_trace(go.Bar(x=list(energy_df["Date"]), y=energy_df[column].tolist(), name=column))
+    return fig
+
+
+def _decode(value):
+    if isinstance(value, dict):
+        if isinstance(value.get("bdata"), str):
+            return np.frombuffer(base64.b64decode(value["bdata"]), dtype=DTYPES[value["dtype"]])
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+def parse_ms(payload, runs=20):
+    if shutil.which("node"):
+        out = subprocess.run(["node", "-e", NODE_PARSE], input=payload, capture_output=True, text=True, check=True)
+        return float(out.stdout)
+    start = time.perf_counter()
+    for _ in range(runs):
+        _decode(json.loads(payload))
+    return (time.perf_counter() - start) * 1000 / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lengths", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--freq", default="15min", help="spacing of the synthetic series")
+    args = parser.parse_args()
+
+    print(f"parse timed in {'node' if shutil.which('node') else 'python'}")
+    print(f"{'chart':<8}{'points':>9}{'json bytes':>14}{'typed bytes':>14}{'ratio':>8}{'json ms':>10}{'typed ms':>10}")
+    for n in args.lengths:
+        equipment_df, _, energy_df = data.generate_synthetic_operations_data(n, freq=args.freq)
+        pairs = [
+            ("uptime", legacy_uptime_chart(equipment_df), charts.create_equipment_uptime_chart.uncached(equipment_df)),
+            ("energy", legacy_energy_chart(energy_df), charts.create_energy_consumption_chart.uncached(energy_df)),
+        ]
+        for name, before, after in pairs:
+            before_json = pio.to_json(before, validate=False)
+            after_json = pio.to_json(after, validate=False)
+            print(
+                f"{name:<8}{n:>9,}{len(before_json):>14,}{len(after_json):>14,}"
+                f"{len(before_json) / len(after_json):>7.1f}x"
+                f"{parse_ms(before_json):>10.2f}{parse_ms(after_json):>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Site report throughput as report workers are added.
+
+Run from the dashboard directory:
+
+    python -m benchmarks.bench_reports --sites 300 --workers 1 2 4 8
+
+Publishes a synthetic snapshot whose meters and assets are spread over
+``--sites`` plants, then runs ``report.generate`` once per worker count into
+a scratch directory and prints sites per second and speedup over one worker.
+Worker start-up and each process's first load of the snapshot are included,
+as they are in a scheduled run.
+"""
+import argparse
+import os
+import tempfile
+
+import report
+from components import data, snapshot
+from utils import config
+from utils.cache import CACHE
+
+
+def build_dataset(directory, n_sites, meters_per_site, interval_days, orders):
+    n_meters = n_sites * meters_per_site
+    scale = n_meters / sum(n for _, n in data.ENERGY_CATEGORIES.values())
+    categories = {name: (kwh * scale, max(1, round(n * scale))) for name, (kwh, n) in data.ENERGY_CATEGORIES.items()}
+    readings, meters = data.generate_interval_energy(days=interval_days, categories=categories)
+    sites = [f"Plant {i + 1:03d}" for i in range(n_sites)]
+    meters["site"] = [sites[i % n_sites] for i in range(len(meters))]
+    # Stand-in asset register for the work orders, read by the dashboard's
+    # index; forked report workers inherit it
+    data.SITES[:] = sites
+    snapshot.publish_snapshot(directory, {"energy_intervals": readings.reset_index(), "meters": meters})
+    log = os.path.join(directory, "work_orders.csv")
+    data.generate_work_order_log(n_orders=orders, n_assets=n_sites * 20).to_csv(log, index=False)
+    return log
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sites", type=int, default=300)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--meters-per-site", type=int, default=6)
+    parser.add_argument("--interval-days", type=int, default=30, help="days of 15-minute meter readings")
+    parser.add_argument("--orders", type=int, default=50_000, help="work orders in the event log")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_dir = os.path.join(directory, "snapshots")
+        log = build_dataset(snapshot_dir, args.sites, args.meters_per_site, args.interval_days, args.orders)
+        # Set before the pool starts so every worker reads the same log
+        os.environ["TEXO_WORK_ORDER_LOG"] = config.WORK_ORDER_LOG = log
+
+        print(f"{'workers':>8}{'seconds':>10}{'sites/s':>10}{'speedup':>9}")
+        baseline = None
+        for workers in args.workers:
+            # Forked workers would otherwise inherit the previous run's cache
+            CACHE.clear()
+            results, elapsed = report.generate(os.path.join(directory, f"out-{workers}"), workers, snapshot_dir)
+            rate = len(results) / elapsed
+            baseline = baseline or rate
+            print(f"{workers:>8}{elapsed:>10.2f}{rate:>10.1f}{rate / baseline:>8.2f}x")
+        print(f"{args.sites} sites on {os.cpu_count()} CPUs")
+
+
+if __name__ == "__main__":
+    main()
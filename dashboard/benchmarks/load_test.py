@@ -0,0 +1,249 @@
+"""Rerun latency, throughput, CPU and memory under concurrent sessions.
+
+Run from the dashboard directory:
+
+    python -m benchmarks.load_test --sessions 1 4 16 --actions 20 --days 90 --meters 200
+
+Starts ``streamlit run app.py`` headless against a synthetic snapshot of the
+requested size and connects N simulated viewers to it over Streamlit's
+websocket protocol, the same messages a browser sends. Each viewer opens the
+dashboard, then switches pages, changes the export site filter or reruns at
+random; every interaction is one timed rerun, from sending the request to
+the server's script-finished message. CPU and RSS are read from /proc for
+the server process. Pass ``--url`` and ``--pid`` to test a running server.
+
+(Streamlit's in-process ``AppTest`` swaps a process-global runtime on every
+run, so it cannot drive concurrent sessions.)
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.asyncio.client import connect
+
+from components import data, snapshot
+
+DASHBOARD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES = ["", "equipment", "maintenance", "energy", "alerts"]
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+
+def build_dataset(directory, days, meters, interval_days, orders):
+    # A snapshot like worker.py publishes, at the requested size
+    equipment_df, maintenance_df, energy_df = data.generate_synthetic_operations_data(days)
+    scale = meters / sum(n for _, n in data.ENERGY_CATEGORIES.values())
+    categories = {name: (kwh, max(1, round(n * scale))) for name, (kwh, n) in data.ENERGY_CATEGORIES.items()}
+    readings, meter_table = data.generate_interval_energy(days=interval_days, categories=categories)
+    snapshot.publish_snapshot(directory, {
+        "equipment": equipment_df,
+        "maintenance": maintenance_df,
+        "energy": energy_df,
+        "energy_intervals": readings.reset_index(),
+        "meters": meter_table,
+    })
+    log = os.path.join(directory, "work_orders.csv")
+    data.generate_work_order_log(n_orders=orders).to_csv(log, index=False)
+    return log
+
+
+def start_server(port, env):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "app.py", "--server.headless", "true",
+         "--server.port", str(port), "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        cwd=DASHBOARD_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    url = f"http://localhost:{port}"
+    for _ in range(300):
+        try:
+            urllib.request.urlopen(f"{url}/_stcore/health", timeout=1)
+            return server, url
+        except OSError:
+            if server.poll() is not None:
+                raise RuntimeError("streamlit server exited during startup")
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("streamlit server did not become healthy")
+
+
+def process_cpu_seconds(pid):
+    with open(f"/proc/{pid}/stat") as stat:
+        fields = stat.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+def process_rss(pid):
+    with open(f"/proc/{pid}/statm") as statm:
+        return int(statm.read().split()[1]) * PAGE_SIZE
+
+
+class Viewer:
+    # One browser session: sends rerun requests and waits for the script to
+    # finish, remembering widget ids by label from the elements it receives
+    def __init__(self, ws):
+        self.ws = ws
+        self.page = ""
+        self.widget_ids = {}
+        self.cached_hashes = set()
+
+    async def rerun(self, widgets=()):
+        msg = BackMsg()
+        msg.rerun_script.page_name = self.page
+        # Like the browser, report cached messages so the server can send
+        # unchanged large elements as hash references
+        msg.rerun_script.cached_message_hashes.extend(self.cached_hashes)
+        for widget_id, values in widgets:
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            state.string_array_value.data.extend(values)
+        await self.ws.send(msg.SerializeToString())
+        failed = False
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.ws.recv())
+            kind = forward.WhichOneof("type")
+            if forward.metadata.cacheable:
+                self.cached_hashes.add(forward.hash)
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "exception":
+                    failed = True
+                elif element_type == "multiselect":
+                    # The sidebar has several multiselects
+                    self.widget_ids[element.multiselect.label] = element.multiselect.id
+            elif kind == "script_finished":
+                if forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return failed
+
+    async def interact(self, rng):
+        action = rng.choice(["page", "page", "sites", "rerun"])
+        if action == "page":
+            self.page = rng.choice(PAGES)
+        if action == "sites" and "Sites" in self.widget_ids:
+            sites = rng.sample(data.SITES, rng.randint(1, len(data.SITES)))
+            return await self.rerun([(self.widget_ids["Sites"], sites)])
+        return await self.rerun()
+
+
+async def viewer_session(url, actions, think, seed, latencies, errors):
+    rng = random.Random(seed)
+    async with connect(url.replace("http", "ws", 1) + "/_stcore/stream", max_size=None) as ws:
+        viewer = Viewer(ws)
+        for i in range(actions + 1):
+            started = time.perf_counter()
+            # The first run is the viewer opening the dashboard
+            failed = await (viewer.rerun() if i == 0 else viewer.interact(rng))
+            latencies.append(time.perf_counter() - started)
+            if failed:
+                errors.append(i)
+            if think:
+                await asyncio.sleep(rng.expovariate(1 / think))
+
+
+async def sample_rss(pid, peak, done):
+    while not done.is_set():
+        peak.append(process_rss(pid))
+        await asyncio.sleep(0.05)
+
+
+async def run_level(url, pid, n_sessions, actions, think, seed):
+    latencies, errors, peak_rss = [], [], [process_rss(pid)]
+    done = asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(pid, peak_rss, done))
+    cpu_before = process_cpu_seconds(pid)
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        viewer_session(url, actions, think, seed + i, latencies, errors) for i in range(n_sessions)
+    ))
+    wall = time.perf_counter() - started
+    cpu = process_cpu_seconds(pid) - cpu_before
+    done.set()
+    await sampler
+
+    ms = np.array(latencies) * 1000
+    p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+    return {
+        "sessions": n_sessions,
+        "reruns": len(latencies),
+        "errors": len(errors),
+        "p50_ms": p50,
+        "p90_ms": p90,
+        "p99_ms": p99,
+        "max_ms": ms.max(),
+        "reruns_per_s": len(latencies) / wall,
+        "cpu_cores": cpu / wall,
+        "peak_rss_mb": max(peak_rss) / 1024 ** 2,
+    }
+
+
+def report(url, pid, args):
+    # One untimed viewer visits every page first, so the levels measure a
+    # server with filled caches, as after warmup.py
+    started = time.perf_counter()
+    asyncio.run(run_level(url, pid, 1, 3 * len(PAGES), 0, args.seed))
+    print(f"cold pass: {time.perf_counter() - started:.2f}s, server rss {process_rss(pid) / 1024 ** 2:,.0f} MB")
+
+    print(f"{'sessions':>8}{'reruns':>8}{'errors':>8}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}"
+          f"{'max ms':>9}{'reruns/s':>10}{'cpu':>7}{'rss MB':>9}")
+    results = []
+    for n in args.sessions:
+        row = asyncio.run(run_level(url, pid, n, args.actions, args.think, args.seed))
+        results.append(row)
+        print(
+            f"{row['sessions']:>8}{row['reruns']:>8}{row['errors']:>8}{row['p50_ms']:>9.0f}{row['p90_ms']:>9.0f}"
+            f"{row['p99_ms']:>9.0f}{row['max_ms']:>9.0f}{row['reruns_per_s']:>10.1f}"
+            f"{row['cpu_cores']:>7.2f}{row['peak_rss_mb']:>9.0f}"
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="concurrency levels")
+    parser.add_argument("--actions", type=int, default=20, help="interactions per session after opening")
+    parser.add_argument("--think", type=float, default=0, help="mean seconds between a viewer's interactions")
+    parser.add_argument("--days", type=int, default=7, help="rows in the daily frames")
+    parser.add_argument("--meters", type=int, default=100, help="energy meters in the interval data")
+    parser.add_argument("--interval-days", type=int, default=365, help="days of 15-minute meter readings")
+    parser.add_argument("--orders", type=int, default=10_000, help="work orders in the event log")
+    parser.add_argument("--port", type=int, default=8599, help="port for the local server")
+    parser.add_argument("--url", help="test an already running server instead of starting one")
+    parser.add_argument("--pid", type=int, help="process id of the --url server, for CPU and RSS")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    if args.url:
+        if not args.pid:
+            parser.error("--url needs --pid to measure the server process")
+        results = report(args.url.rstrip("/"), args.pid, args)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            log = build_dataset(directory, args.days, args.meters, args.interval_days, args.orders)
+            env = dict(os.environ, TEXO_SNAPSHOT_DIR=directory, TEXO_WORK_ORDER_LOG=log,
+                       TEXO_ARTIFACT_DIR=os.path.join(directory, "artifacts"))
+            server, url = start_server(args.port, env)
+            try:
+                results = report(url, server.pid, args)
+            finally:
+                server.terminate()
+                server.wait()
+
+    if args.json:
+        with open(args.json, "w") as out:
+            json.dump(results, out, indent=2, default=float)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import time
+import numpy as np
+from components import alert_store, telemetry
+
+# Smoothing applied before threshold checks so one noisy sample neither
+# raises nor clears an alert
+SMOOTHING_SAMPLES = 60
+
+# "clear" is the hysteresis level: an open alert stays open until the
+# reading is back past it, not merely back past the trigger threshold
+
+RULES = [
+    {"rule": "temperature_high", "channel": "compressor_7.temperature", "kind": "above", "threshold": 85, "clear": 84,
+     "status": "High", "issue": "Temperature exceeding threshold", "action": "Inspect cooling system"},
+    {"rule": "refrigerant_pressure_low", "channel": "chiller_3.refrigerant_pressure", "kind": "below", "threshold": 60, "clear": 61,
+     "status": "Medium", "issue": "Low refrigerant pressure", "action": "Check for leaks"},
+    {"rule": "battery_voltage_low", "channel": "generator_2.battery_voltage", "kind": "below", "threshold": 12.3, "clear": 12.35,
+     "status": "Medium", "issue": "Battery voltage low", "action": "Test and replace battery"},
+    {"rule": "vibration_rising", "channel": "production_line_b.vibration", "kind": "rising", "threshold": 0.1, "clear": 0.05,
+     "window": 2 * 3600, "status": "High", "issue": "Vibration levels increasing", "action": "Schedule bearing inspection"},
+]
+
+def moving_average(values, n):
+    if len(values) < n:
+        return np.asarray(values, dtype="float64")
+    csum = np.cumsum(values, dtype="float64")
+    csum[n:] = csum[n:] - csum[:-n]
+    return csum[n - 1:] / n
+
+def format_duration(seconds):
+    if seconds >= 2 * 86400:
+        return f"{seconds / 86400:.0f} days"
+    if seconds >= 2 * 3600:
+        return f"{seconds / 3600:.0f} hours"
+    if seconds >= 3600:
+        return "1 hour"
+    return f"{max(seconds, 60) / 60:.0f} min"
+
+def _level(rule, active):
+    return rule.get("clear", rule["threshold"]) if active else rule["threshold"]
+
+def _threshold_breach(rule, times, values, active=False):
+    smoothed = moving_average(values, SMOOTHING_SAMPLES)
+    times = times[len(times) - len(smoothed):]
+    if rule["kind"] == "above":
+        breaching = smoothed > _level(rule, active)
+    else:
+        breaching = smoothed < _level(rule, active)
+    if not len(breaching) or not breaching[-1]:
+        return None
+    # The breach started right after the last sample that was within limits
+    ok = np.flatnonzero(~breaching)
+    since = times[ok[-1] + 1] if len(ok) else times[0]
+    return float(since), float(smoothed[-1])
+
+def _trend_breach(rule, times, values, active=False):
+    start = np.searchsorted(times, times[-1] - rule["window"])
+    times, values = times[start:], values[start:]
+    if len(times) < 2:
+        return None
+    hours = (times - times[0]) / 3600
+    slope = np.polyfit(hours, values.astype("float64"), 1)[0]
+    if slope <= _level(rule, active):
+        return None
+    return float(times[0]), float(slope)
+
+def evaluate(store=None, alerts=None, now=None):
+    store = store or telemetry.get_store()
+    alerts = alert_store.get_store() if alerts is None else alerts
+    now = time.time() if now is None else now
+    for rule in RULES:
+        times, values = store.window(rule["channel"], store.hours * 3600)
+        if not len(times):
+            continue
+        equipment = telemetry.CHANNELS[rule["channel"]]["equipment"]
+        active = alerts.is_active(equipment, rule["rule"], rule["status"])
+        check = _trend_breach if rule["kind"] == "rising" else _threshold_breach
+        breach = check(rule, times, values, active)
+        if breach is None:
+            continue
+        since, value = breach
+        alerts.fire(
+            equipment, rule["rule"], rule["status"], float(times[-1]), since=since,
+            value=value, issue=rule["issue"], action=rule["action"],
+        )
+    alerts.sweep(now)
+
+    # One row per open problem, however many times its rule fired
+    active_alerts = sorted(alerts.active(), key=lambda alert: (alert["severity"] != "High", alert["first_seen"]))
+    return [{
+        "equipment": alert["asset"],
+        "issue": alert["issue"],
+        "status": alert["severity"],
+        "duration": format_duration(alert["last_seen"] - alert["first_seen"]),
+        "action": alert["action"],
+        "rule": alert["rule"],
+        "value": alert["value"],
+        "since": alert["first_seen"],
+        "count": alert["count"],
+        "state": alert["state"],
+        "key": alert["key"],
+    } for alert in active_alerts]
@@ -0,0 +1,90 @@
+import hashlib
+import sys
+import threading
+from collections import deque
+from utils import config
+
+def alert_key(asset, rule, severity):
+    # Stable across processes, so downstream notifications can dedupe on it too
+    return hashlib.blake2b(f"{asset}\x1f{rule}\x1f{severity}".encode(), digest_size=8).hexdigest()
+
+class AlertStore:
+    # One record per distinct (asset, rule, severity). Repeat firings update
+    # the open record in place; a record only resolves after clear_seconds
+    # without firing, is held open while it flaps, and is dropped
+    # expire_seconds after it resolves. Size follows the number of distinct
+    # problems, not how often rules fire.
+    def __init__(self, clear_seconds=None, flap_window=None, flap_limit=None, expire_seconds=None):
+        self.clear_seconds = config.ALERT_CLEAR_SECONDS if clear_seconds is None else clear_seconds
+        self.flap_window = config.ALERT_FLAP_WINDOW_SECONDS if flap_window is None else flap_window
+        self.flap_limit = config.ALERT_FLAP_LIMIT if flap_limit is None else flap_limit
+        self.expire_seconds = config.ALERT_EXPIRE_SECONDS if expire_seconds is None else expire_seconds
+        self._alerts = {}
+        self._lock = threading.Lock()
+        self.firings = 0
+
+    def fire(self, asset, rule, severity, now, since=None, **details):
+        key = alert_key(asset, rule, severity)
+        with self._lock:
+            alert = self._alerts.get(key)
+            if alert is None:
+                alert = self._alerts[key] = {
+                    "key": key, "asset": asset, "rule": rule, "severity": severity,
+                    "first_seen": now if since is None else min(since, now), "last_seen": None,
+                    "count": 0, "state": "open", "resolved_at": None, "reopens": deque(),
+                }
+            elif alert["state"] == "resolved":
+                # Reopening: count it towards flap damping
+                reopens = alert["reopens"]
+                reopens.append(now)
+                while reopens and reopens[0] < now - self.flap_window:
+                    reopens.popleft()
+                alert["state"] = "flapping" if len(reopens) >= self.flap_limit else "open"
+                alert["resolved_at"] = None
+                if alert["state"] == "open":
+                    alert["first_seen"] = now if since is None else min(since, now)
+            # Several sessions evaluate the same readings; only newer data counts
+            # as another firing
+            if alert["last_seen"] is None or now > alert["last_seen"]:
+                alert["count"] += 1
+                alert["last_seen"] = now
+                self.firings += 1
+            alert.update(details)
+            return alert
+
+    def sweep(self, now):
+        # Resolve alerts that stopped firing, settle flapping ones and drop
+        # expired records
+        with self._lock:
+            for key, alert in list(self._alerts.items()):
+                quiet = now - alert["last_seen"]
+                if alert["state"] == "open" and quiet >= self.clear_seconds:
+                    alert["state"], alert["resolved_at"] = "resolved", now
+                elif alert["state"] == "flapping" and quiet >= self.flap_window:
+                    alert["state"], alert["resolved_at"] = "resolved", now
+                    alert["reopens"].clear()
+                elif alert["state"] == "resolved" and now - alert["resolved_at"] >= self.expire_seconds:
+                    del self._alerts[key]
+
+    def get(self, asset, rule, severity):
+        return self._alerts.get(alert_key(asset, rule, severity))
+
+    def is_active(self, asset, rule, severity):
+        alert = self.get(asset, rule, severity)
+        return alert is not None and alert["state"] != "resolved"
+
+    def active(self):
+        with self._lock:
+            return [dict(alert) for alert in self._alerts.values() if alert["state"] != "resolved"]
+
+    def __len__(self):
+        return len(self._alerts)
+
+    @property
+    def nbytes(self):
+        return sum(sys.getsizeof(alert) for alert in self._alerts.values())
+
+_store = AlertStore()
+
+def get_store():
+    return _store
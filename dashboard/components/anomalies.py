@@ -0,0 +1,141 @@
+import threading
+import numpy as np
+import pandas as pd
+from components import data, ingest, rollups
+
+class EwmaDetector:
+    # Exponentially weighted z-scores for every column of a wide frame at
+    # once. fit() scores a full history with vectorized ewm; update() carries
+    # the same recurrence forward one time step at a time for new rows.
+    def __init__(self, alpha=0.1, threshold=3.0, min_periods=7, min_std=0.0, min_rel_std=0.0):
+        self.alpha = alpha
+        self.threshold = threshold
+        self.min_periods = min_periods
+        self.min_std = min_std
+        self.min_rel_std = min_rel_std
+        self.columns = None
+        self.last_index = None
+        self.mean = None
+        self.var = None
+        self.count = None
+        self.expected = None
+        self._lock = threading.Lock()
+
+    def _std(self, mean, var):
+        return np.maximum(np.sqrt(var), np.maximum(self.min_std, self.min_rel_std * np.abs(mean)))
+
+    def fit(self, history):
+        ewm = history.ewm(alpha=self.alpha, adjust=False, ignore_na=True)
+        mean = ewm.mean()
+        var = ewm.var(bias=True)
+        count = history.notna().cumsum()
+        prev_mean, prev_var = mean.shift(1), var.shift(1)
+        z = (history - prev_mean) / self._std(prev_mean, prev_var)
+        z = z.where(count.shift(1) >= self.min_periods)
+
+        self.columns = history.columns
+        self.expected = prev_mean.iloc[-1].to_numpy(dtype="float64")
+        self.last_index = history.index[-1]
+        self.mean = mean.iloc[-1].to_numpy(dtype="float64")
+        self.var = var.iloc[-1].fillna(0).to_numpy(dtype="float64")
+        self.count = count.iloc[-1].to_numpy()
+        return z
+
+    def update(self, rows):
+        values = rows.reindex(columns=self.columns).to_numpy(dtype="float64")
+        scores = np.full(values.shape, np.nan)
+        a = self.alpha
+        for i, x in enumerate(values):
+            valid = ~np.isnan(x)
+            z = (x - self.mean) / self._std(self.mean, self.var)
+            scores[i] = np.where(valid & (self.count >= self.min_periods), z, np.nan)
+            self.expected = self.mean
+            diff = np.where(valid, x - self.mean, 0.0)
+            increment = a * diff
+            self.mean = self.mean + increment
+            self.var = np.where(valid, (1 - a) * (self.var + diff * increment), self.var)
+            self.count = self.count + valid
+        self.last_index = rows.index[-1]
+        return pd.DataFrame(scores, index=rows.index, columns=self.columns)
+
+    def scan(self, wide):
+        # Score whatever is new since the last call; refit if the set of
+        # assets changed
+        with self._lock:
+            if self.columns is None or not wide.columns.equals(self.columns):
+                return self.fit(wide)
+            new = wide[wide.index > self.last_index]
+            if new.empty:
+                return new.astype("float64")
+            return self.update(new)
+
+_detectors = {
+    "uptime": EwmaDetector(alpha=0.3, threshold=2.5, min_periods=3, min_std=1.0),
+    "meter_daily_kwh": EwmaDetector(alpha=0.1, threshold=3.0, min_periods=14, min_rel_std=0.03),
+}
+_latest = {}
+
+def get_detector(name):
+    return _detectors[name]
+
+def latest_scores(name, wide):
+    # Most recent score per column, kept between scans that find nothing new
+    scores = _detectors[name].scan(wide)
+    if not scores.empty:
+        expected = pd.Series(_detectors[name].expected, index=scores.columns)
+        _latest[name] = (scores.index[-1], scores.iloc[-1], wide.loc[scores.index[-1]], expected)
+    return _latest.get(name)
+
+def trailing_run(mask):
+    # Length of the run of True values ending at the last row, per column
+    values = mask.to_numpy()
+    breaks = np.where(~values, np.arange(len(values))[:, None] + 1, 0)
+    return len(values) - breaks.max(axis=0)
+
+def performance_highlights(equipment_df, readings, alerts=(), comparisons=None, limit=4):
+    # Items are (rank, magnitude, text): active alerts outrank anomalies,
+    # which outrank period-over-period changes
+    positive, watch = [], []
+
+    uptime = equipment_df.set_index(pd.to_datetime(equipment_df["Date"])).drop(columns=["Date", ingest.GAP_COLUMN], errors="ignore")
+    streaks = trailing_run(uptime >= 99.5)
+    for asset, days in zip(uptime.columns, streaks):
+        if days >= 3:
+            positive.append((2, days, f"{asset} uptime at 100% for {days} days"))
+
+    latest = latest_scores("uptime", uptime)
+    if latest is not None:
+        _, z, values, _ = latest
+        for asset in z.index[z <= -_detectors["uptime"].threshold]:
+            watch.append((2, abs(z[asset]), f"{asset} uptime down to {values[asset]:.0f}% ({abs(z[asset]):.1f}σ below trend)"))
+
+    # Daily kWh per meter over complete days only
+    daily = data.daily_totals(readings)
+    latest = latest_scores("meter_daily_kwh", daily)
+    if latest is not None:
+        day, z, values, expected = latest
+        threshold = _detectors["meter_daily_kwh"].threshold
+        change = (values / expected - 1) * 100
+        for meter in z.index[z >= threshold]:
+            watch.append((2, z[meter], f"Meter {meter} used {change[meter]:.0f}% more energy than usual on {day:%b %d}"))
+        for meter in z.index[z <= -threshold]:
+            positive.append((2, abs(z[meter]), f"Meter {meter} used {abs(change[meter]):.0f}% less energy than usual on {day:%b %d}"))
+
+    for alert in alerts:
+        severity = 2 if alert["status"] == "High" else 1
+        watch.append((3, severity, f"{alert['equipment']}: {alert['issue'].lower()}"))
+
+    if comparisons is not None:
+        better, worse = rollups.comparison_sentences(comparisons)
+        positive += [(1, magnitude, text) for magnitude, text in better]
+        watch += [(1, magnitude, text) for magnitude, text in worse]
+
+    vs_target = rollups.energy_vs_target(readings)
+    if vs_target is not None and vs_target < 0:
+        positive.append((1, abs(vs_target), f"Energy consumption {abs(vs_target):.0f}% below target yesterday"))
+    elif vs_target is not None and vs_target > 5:
+        watch.append((1, vs_target, f"Energy consumption {vs_target:.0f}% above target yesterday"))
+
+    def top(items):
+        return [text for _, _, text in sorted(items, key=lambda item: (-item[0], -item[1]))[:limit]]
+    return top(positive), top(watch)
@@ -0,0 +1,165 @@
+import io
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+from utils.intervals import next_in_group, split_intervals
+
+STATES = ("run", "stop", "fault")
+# Only faults count against availability; a stopped asset is available
+DOWN_STATES = ("fault",)
+STATE_LOG_COLUMNS = ["asset_id", "timestamp", "state"]
+
+
+class AvailabilityTracker:
+    # Time in each state per (period, asset) from PLC state transitions. A
+    # transition opens an interval that lasts until the asset's next one;
+    # closed intervals are split at period boundaries and summed once, and
+    # each asset's latest state stays open and is counted up to the query
+    # time. New batches only touch the rows they bring.
+    def __init__(self, freq="1D"):
+        self.period = pd.Timedelta(freq).as_unit("ns").value
+        # Reentrant: consume() holds it across reset() and ingest()
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._durations = pd.Series(dtype="float64", index=pd.MultiIndex.from_arrays(
+                [np.array([], dtype="int64")] * 3, names=["period", "asset_id", "state"]
+            ))
+            # Latest transition per asset: the still-open interval
+            self._open = pd.DataFrame({"timestamp": np.array([], dtype="int64"), "state": np.array([], dtype="int8")})
+            self._offset = 0
+            self._header = None
+            self.transitions = 0
+            self.late = 0
+
+    def _pieces(self, assets, starts, ends, states):
+        # Durations per (period, asset, state) for the given intervals
+        lo, hi = starts.min() // self.period, -(-ends.max() // self.period)
+        edges = np.arange(lo, hi + 1, dtype="int64") * self.period
+        interval, window, length = split_intervals(starts, ends, edges)
+        pieces = pd.DataFrame({
+            "period": window + lo, "asset_id": assets[interval], "state": states[interval], "ns": length,
+        })
+        return pieces.groupby(["period", "asset_id", "state"])["ns"].sum().astype("float64")
+
+    def ingest(self, transitions):
+        # transitions: asset_id, timestamp (ISO string or datetime), state
+        # name; unknown states are ignored
+        codes = pd.Categorical(transitions["state"], categories=STATES).codes
+        batch = pd.DataFrame({
+            "asset_id": transitions["asset_id"].to_numpy(dtype="int64"),
+            "timestamp": pd.to_datetime(transitions["timestamp"], format="ISO8601").dt.as_unit("ns").astype("int64").to_numpy(),
+            "state": codes.astype("int8"),
+        })[codes >= 0]
+        with self._lock:
+            # Anything older than an asset's open transition arrived too late
+            # to place; it is counted and dropped
+            since = self._open["timestamp"].reindex(batch["asset_id"]).to_numpy()
+            late = since > batch["timestamp"].to_numpy()
+            self.late += int(late.sum())
+            batch = batch[~late]
+            if batch.empty:
+                return 0
+
+            # Reopen each touched asset's open interval ahead of its new rows
+            reopened = self._open.loc[self._open.index.intersection(batch["asset_id"].unique())]
+            rows = pd.concat([reopened.rename_axis("asset_id").reset_index(), batch], ignore_index=True)
+            assets = rows["asset_id"].to_numpy()
+            order = np.lexsort((rows["timestamp"].to_numpy(), assets))
+            assets = assets[order]
+            times = rows["timestamp"].to_numpy()[order]
+            states = rows["state"].to_numpy()[order]
+            ends, is_last = next_in_group(assets, times, times.max())
+
+            closed = ~is_last
+            if closed.any():
+                added = self._pieces(assets[closed], times[closed], ends[closed], states[closed])
+                self._durations = self._durations.add(added, fill_value=0)
+            latest = pd.DataFrame({"timestamp": times[is_last], "state": states[is_last]}, index=assets[is_last])
+            self._open = pd.concat([self._open.drop(latest.index, errors="ignore"), latest]).sort_index()
+            self.transitions += len(batch)
+            return len(batch)
+
+    def consume(self, path):
+        # Read only what was appended to a CSV log since the last call; a log
+        # that shrank was rotated and is read again from the start. Sessions
+        # loading at once would otherwise read from the same offset
+        with self._lock:
+            if os.path.getsize(path) < self._offset:
+                self.reset()
+            with open(path, "rb") as f:
+                f.seek(self._offset)
+                chunk = f.read()
+            complete = chunk[:chunk.rfind(b"\n") + 1]
+            if not complete.strip():
+                return 0
+            header = self._header is None
+            frame = pd.read_csv(io.BytesIO(complete), header=0 if header else None, names=None if header else self._header)
+            self._header = self._header or list(frame.columns)
+            self._offset += len(complete)
+            return self.ingest(frame)
+
+    def durations(self, now=None):
+        # Seconds per (period, asset, state), including open intervals up
+        # to now
+        with self._lock:
+            closed, open_ = self._durations, self._open
+        if open_.empty:
+            return closed / 1e9
+        now = pd.Timestamp.now().as_unit("ns").value if now is None else pd.Timestamp(now).as_unit("ns").value
+        starts = open_["timestamp"].to_numpy()
+        current = starts < now
+        if current.any():
+            ongoing = self._pieces(
+                open_.index.to_numpy()[current], starts[current], np.full(current.sum(), now, dtype="int64"),
+                open_["state"].to_numpy()[current],
+            )
+            closed = closed.add(ongoing, fill_value=0)
+        return closed / 1e9
+
+    def availability(self, now=None, groups=None):
+        # Percent of observed time not in a down state per period (rows) and
+        # asset (columns); groups maps assets to labels for time-weighted
+        # group figures instead
+        seconds = self.durations(now)
+        if seconds.empty:
+            return pd.DataFrame()
+        by_state = seconds.unstack("state", fill_value=0.0)
+        down_codes = [STATES.index(s) for s in DOWN_STATES if STATES.index(s) in by_state.columns]
+        observed = by_state.sum(axis=1)
+        up = observed - by_state[down_codes].sum(axis=1)
+        frame = pd.DataFrame({"up": up, "observed": observed})
+        if groups is not None:
+            labels = groups(frame.index.get_level_values("asset_id").to_numpy())
+            frame = frame.groupby([frame.index.get_level_values("period"), labels]).sum()
+        wide = (frame["up"] / frame["observed"] * 100).unstack(level=1)
+        wide.index = pd.to_datetime(wide.index * self.period, unit="ns")
+        return wide
+
+    @property
+    def nbytes(self):
+        return int(self._durations.memory_usage(index=True) + self._open.memory_usage(index=True).sum())
+
+
+_trackers = {}
+_trackers_lock = threading.Lock()
+
+
+def get_tracker(path):
+    # One tracker per log file, kept across refreshes so each one only reads
+    # new transitions
+    with _trackers_lock:
+        return _trackers.setdefault(path, AvailabilityTracker())
+
+
+def equipment_frame(tracker, groups, columns, days=7, now=None):
+    # The equipment uptime frame (Date + one column per asset type) computed
+    # from transitions instead of delivered as percentages
+    by_type = tracker.availability(now, groups=groups).tail(days)
+    frame = by_type.reindex(columns=columns).round(1)
+    frame.insert(0, "Date", frame.index.strftime("%Y-%m-%d"))
+    return frame.reset_index(drop=True).rename_axis(columns=None)
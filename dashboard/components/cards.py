@@ -0,0 +1,78 @@
+import html
+import streamlit as st
+
+# Card markup as module-level templates: each card is one str.format_map over
+# a constant, with no per-call f-string assembly or indentation whitespace
+STATUS_CARD = (
+    '<div class="summary-card"><div class="metric-value {status_class}">{value}</div>'
+    '<div class="metric-label">{label}</div>{delta}'
+    '<div class="card-target"><small>Target: {target}</small></div></div>'
+)
+DELTA = '<div class="card-delta {delta_class}">{text}</div>'
+LIST_CARD = '<div class="summary-card"><div class="card-title"{title_style}>{title}</div><ul>{items}</ul></div>'
+LIST_ITEM = "<li>{}</li>"
+PANEL = '<div class="summary-card"{style}>{heading}{body}</div>'
+HEADING = '<div class="card-heading">{}</div>'
+ROW = '<div class="card-row"><span>{label}</span><span{value_style}>{value}</span></div>'
+GRID = '<div class="card-grid" style="--columns: {columns};">{cards}</div>'
+METRICS = '<div class="card-metrics">{}</div>'
+METRIC = '<div><div class="metric-value {status_class}">{value}</div><div class="metric-label">{label}</div></div>'
+TABLE = '<table class="card-table"><thead><tr>{head}</tr></thead><tbody>{rows}</tbody></table>'
+TABLE_ROW = "<tr>{}</tr>"
+
+def status_card(value, label, target, status_class, delta=None):
+    delta_html = "" if delta is None else DELTA.format_map({
+        "delta_class": "normal" if delta["good"] else "critical",
+        "text": html.escape(delta["text"]),
+    })
+    return STATUS_CARD.format_map({
+        "status_class": status_class,
+        "value": html.escape(str(value)),
+        "label": html.escape(label),
+        "delta": delta_html,
+        "target": html.escape(target),
+    })
+
+def list_card(title, items, title_style="", empty_text="Nothing to report"):
+    items = [html.escape(item) for item in items] or [html.escape(empty_text)]
+    return LIST_CARD.format_map({
+        "title_style": f' style="{title_style.strip()}"' if title_style else "",
+        "title": html.escape(title),
+        "items": "".join(map(LIST_ITEM.format, items)),
+    })
+
+def row(label, value, value_style=""):
+    return ROW.format_map({
+        "label": html.escape(label),
+        "value_style": f' style="{value_style}"' if value_style else "",
+        "value": html.escape(str(value)),
+    })
+
+def panel(body, heading=None, style=""):
+    # body is already-rendered markup (rows, metrics)
+    return PANEL.format_map({
+        "style": f' style="{style}"' if style else "",
+        "heading": "" if heading is None else HEADING.format(html.escape(heading)),
+        "body": body,
+    })
+
+def metrics(items):
+    # Side-by-side metrics: (value, label, status_class) tuples
+    return METRICS.format("".join(
+        METRIC.format_map({"status_class": status_class, "value": html.escape(str(value)), "label": html.escape(label)})
+        for value, label, status_class in items
+    ))
+
+def table(columns, rows):
+    # Label column on the left, values right-aligned by the stylesheet
+    return TABLE.format_map({
+        "head": "".join(f"<th>{html.escape(str(c))}</th>" for c in columns),
+        "rows": "".join(TABLE_ROW.format("".join(f"<td>{html.escape(str(v))}</td>" for v in row)) for row in rows),
+    })
+
+def grid(cards, columns=4):
+    return GRID.format_map({"columns": columns, "cards": "".join(cards)})
+
+def render_grid(cards, columns=4):
+    # The whole grid is one markdown element, however many cards it holds
+    st.markdown(grid(cards, columns), unsafe_allow_html=True)
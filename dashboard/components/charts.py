@@ -1,7 +1,21 @@
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
+from utils.cache import cached
+from utils.payload import date_axis, typed_array
+from components import ingest, kpis
 
+def _shade_gaps(fig, df):
+    # Days with no readings for some metric are shaded rather than drawn as
+    # if the series were complete
+    for day in ingest.gap_days(df):
+        day = pd.Timestamp(day)
+        fig.add_vrect(
+            x0=day - pd.Timedelta(hours=12), x1=day + pd.Timedelta(hours=12),
+            fillcolor="#9ca3af", opacity=0.15, line_width=0,
+            annotation_text="No data", annotation_position="top left", annotation_font_size=10
+        )
+
+@cached("charts")
 def create_equipment_uptime_chart(equipment_df):
     fig = go.Figure()
     
@@ -13,15 +27,19 @@ def create_equipment_uptime_chart(equipment_df):
         "Production Line": "#f59e0b"
     }
     
+    # Dates and values go out as compact typed arrays rather than JSON text
+    x = date_axis(equipment_df["Date"])
     for column in ["Chillers", "Compressors", "Generators", "Production Line"]:
         fig.add_trace(go.Scatter(
-            x=equipment_df["Date"], 
-            y=equipment_df[column],
+            **x,
+            y=typed_array(equipment_df[column]),
             name=column,
             line=dict(color=colors[column], width=3),
             mode="lines+markers"
         ))
     
+    _shade_gaps(fig, equipment_df)
+    
     # Add target line
     fig.add_hline(y=95, line_dash="dash", line_color="green", annotation_text="Target: 95%")
     
@@ -30,87 +48,125 @@ def create_equipment_uptime_chart(equipment_df):
         title="Equipment Uptime - Last 7 Days",
         yaxis_title="Uptime (%)",
         xaxis_title="Date",
+        xaxis_type="date",
         height=400,
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
     )
     
     return fig
 
+@cached("charts")
 def create_maintenance_chart(maintenance_df):
     fig = go.Figure()
+    x = date_axis(maintenance_df["Date"])
     
     fig.add_trace(go.Bar(
-        x=maintenance_df["Date"],
-        y=maintenance_df["Completed Work Orders"],
+        **x,
+        y=typed_array(maintenance_df["Completed Work Orders"]),
         name="Completed",
         marker_color="#10b981"
     ))
     
     fig.add_trace(go.Bar(
-        x=maintenance_df["Date"],
-        y=maintenance_df["Pending Work Orders"],
+        **x,
+        y=typed_array(maintenance_df["Pending Work Orders"]),
         name="Pending",
         marker_color="#f59e0b"
     ))
     
     fig.add_trace(go.Bar(
-        x=maintenance_df["Date"],
-        y=maintenance_df["Emergency Repairs"],
+        **x,
+        y=typed_array(maintenance_df["Emergency Repairs"]),
         name="Emergency",
         marker_color="#ef4444"
     ))
     
+    _shade_gaps(fig, maintenance_df)
+    
     fig.update_layout(
         title="Work Order Status - Last 7 Days",
         barmode="stack",
         height=400,
+        xaxis_type="date",
         yaxis_title="Number of Work Orders"
     )
     
     return fig
 
-def create_energy_consumption_chart(energy_df):
-    melted_df = energy_df.melt(
-        id_vars="Date", 
-        value_vars=["Chillers (kWh)", "Compressors (kWh)", "Lighting (kWh)"],
-        var_name="Equipment", 
-        value_name="kWh"
-    )
+@cached("charts")
+def create_energy_consumption_chart(energy_df, forecast=None):
+    fig = go.Figure()
     
-    fig = px.bar(
-        melted_df,
-        x="Date", 
-        y="kWh",
-        color="Equipment",
-        title="Energy Consumption by Equipment",
-        labels={"kWh": "Energy Consumption (kWh)"},
-        color_discrete_map={
-            "Chillers (kWh)": "#3b82f6",
-            "Compressors (kWh)": "#ef4444",
-            "Lighting (kWh)": "#f59e0b"
-        }
-    )
+    colors = {
+        "Chillers (kWh)": "#3b82f6",
+        "Compressors (kWh)": "#ef4444",
+        "Lighting (kWh)": "#f59e0b"
+    }
+    
+    # One bar trace per column; the long-format melt this replaced turned the
+    # dates back into repeated text on the wire
+    x = date_axis(energy_df["Date"])
+    for column in ["Chillers (kWh)", "Compressors (kWh)", "Lighting (kWh)"]:
+        fig.add_trace(go.Bar(
+            **x,
+            y=typed_array(energy_df[column]),
+            name=column,
+            marker_color=colors[column]
+        ))
+    
+    _shade_gaps(fig, energy_df)
+    
+    # Fleet forecast for the coming days: 80% band behind the expected total
+    if forecast is not None:
+        fleet = forecast["categories"]
+        x = date_axis(fleet["forecast"].index)
+        fig.add_trace(go.Scatter(
+            **x, y=typed_array(fleet["upper"]["Fleet"]), mode="lines",
+            line=dict(width=0), hoverinfo="skip", showlegend=False
+        ))
+        fig.add_trace(go.Scatter(
+            **x, y=typed_array(fleet["lower"]["Fleet"]), mode="lines", name="Forecast range (80%)",
+            line=dict(width=0), fill="tonexty", fillcolor="rgba(99, 102, 241, 0.2)"
+        ))
+        fig.add_trace(go.Scatter(
+            **x, y=typed_array(fleet["forecast"]["Fleet"]), mode="lines+markers", name="Forecast total",
+            line=dict(color="#6366f1", width=2, dash="dash")
+        ))
     
     fig.update_layout(
+        title="Energy Consumption by Equipment",
         barmode="stack",
         height=400,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        xaxis_title="Date",
+        xaxis_type="date",
+        yaxis_title="Energy Consumption (kWh)",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, title_text="Equipment")
     )
     
     return fig
 
-def create_energy_gauge(energy_df):
-    avg_energy = energy_df["Total (kWh)"].mean()
-    target_energy = 9500
+@cached("charts")
+def create_energy_gauge(energy_df, percentiles=None):
+    summary = kpis.energy_kpis(energy_df)
+    value = summary["avg_energy"]
+    target_energy = summary["target_energy"]
+    title = "Average Daily Energy"
+    axis_max = 11000
+    
+    # Read the median and tail from the fleet quantile sketches when available
+    if percentiles is not None:
+        value = percentiles[0.5]
+        title = f"Median Daily Energy<br><span style='font-size: 0.8em; color: gray;'>p95 {percentiles[0.95]:,.0f} · p99 {percentiles[0.99]:,.0f} kWh</span>"
+        axis_max = max(axis_max, percentiles[0.99] * 1.05)
     
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
-        value=avg_energy,
+        value=value,
         number={"suffix": " kWh"},
         domain={"x": [0, 1], "y": [0, 1]},
-        title={"text": "Average Daily Energy", "font": {"size": 16}},
+        title={"text": title, "font": {"size": 16}},
         gauge={
-            "axis": {"range": [None, 11000], "tickwidth": 1, "tickcolor": "darkblue"},
+            "axis": {"range": [None, axis_max], "tickwidth": 1, "tickcolor": "darkblue"},
             "bar": {"color": "#3b82f6"},
             "bgcolor": "white",
             "borderwidth": 2,
@@ -118,7 +174,7 @@ def create_energy_gauge(energy_df):
             "steps": [
                 {"range": [0, 9500], "color": "#10b981"},
                 {"range": [9500, 10000], "color": "#f59e0b"},
-                {"range": [10000, 11000], "color": "#ef4444"}],
+                {"range": [10000, axis_max], "color": "#ef4444"}],
             "threshold": {
                 "line": {"color": "black", "width": 4},
                 "thickness": 0.75,
@@ -128,4 +184,22 @@ def create_energy_gauge(energy_df):
     ))
     
     fig.update_layout(height=350, margin=dict(t=50, b=10, l=20, r=20))
-    return fig
\ No newline at end of file
+    return fig
+
+
+@cached("charts")
+def create_backlog_age_chart(backlog_df):
+    fig = go.Figure(go.Bar(
+        x=backlog_df["Age"],
+        y=typed_array(backlog_df["Open Work Orders"]),
+        marker_color=["#10b981", "#10b981", "#f59e0b", "#f59e0b", "#ef4444", "#ef4444"][:len(backlog_df)]
+    ))
+    
+    fig.update_layout(
+        title="Open Work Order Backlog by Age",
+        height=350,
+        xaxis_title="Age",
+        yaxis_title="Open Work Orders"
+    )
+    
+    return fig
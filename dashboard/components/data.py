@@ -1,6 +1,13 @@
+import os
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from components import availability, ingest, snapshot
+from utils import artifacts, config, engine, metrics
+from utils.bitmap import BitmapIndex
+from utils.cache import CACHE, cached
+
+FRAME_NAMES = ("equipment", "maintenance", "energy")
 
 def generate_operations_data():
     dates = pd.date_range(end=datetime.today(), periods=7, freq="D").strftime("%Y-%m-%d")
@@ -35,6 +42,404 @@ def generate_operations_data():
         pd.DataFrame(energy_data)
     )
 
-def load_data():
+def generate_synthetic_operations_data(periods=7, freq="D", seed=0):
+    # Same shape as generate_operations_data at any length, for benchmarks
+    rng = np.random.default_rng(seed)
+    date_format = "%Y-%m-%d" if freq == "D" else "%Y-%m-%d %H:%M"
+    dates = pd.date_range(end=datetime.today(), periods=periods, freq=freq).strftime(date_format)
+
+    def uptime(mean, spread):
+        return np.clip(rng.normal(mean, spread, periods), 0, 100).round().astype(int)
+
+    def counts(mean):
+        return rng.poisson(mean, periods)
+
+    chillers = rng.normal(4300, 180, periods).round().astype(int)
+    compressors = rng.normal(3850, 160, periods).round().astype(int)
+    lighting = np.full(periods, 1200)
+
+    equipment_data = {
+        "Date": dates,
+        "Chillers": uptime(97, 1.5),
+        "Compressors": uptime(94, 2),
+        "Generators": uptime(99.5, 0.5),
+        "Production Line": uptime(94, 2.5)
+    }
+
+    maintenance_data = {
+        "Date": dates,
+        "Completed Work Orders": counts(13),
+        "Pending Work Orders": counts(7),
+        "Emergency Repairs": counts(2),
+        "Preventive Maintenance": counts(7)
+    }
+
+    energy_data = {
+        "Date": dates,
+        "Chillers (kWh)": chillers,
+        "Compressors (kWh)": compressors,
+        "Lighting (kWh)": lighting,
+        "Total (kWh)": chillers + compressors + lighting
+    }
+
+    return (
+        pd.DataFrame(equipment_data),
+        pd.DataFrame(maintenance_data),
+        pd.DataFrame(energy_data)
+    )
+
+# Baseline, drift per hour and noise for each synthetic sensor channel
+SENSOR_PROFILES = {
+    "compressor_7.temperature": (80.0, 1.5, 0.8),
+    "chiller_3.refrigerant_pressure": (62.0, -0.4, 0.6),
+    "generator_2.battery_voltage": (12.4, -0.02, 0.05),
+    "production_line_b.vibration": (3.0, 0.25, 0.3),
+}
+
+def generate_sensor_readings(channel, start, end, hz=1.0):
+    baseline, drift, noise = SENSOR_PROFILES[channel]
+    timestamps = np.arange(np.ceil(start * hz), np.floor(end * hz) + 1) / hz
+    # Drift restarts every 6 hours so the demo keeps crossing thresholds
+    hours_into_cycle = (timestamps % (6 * 3600)) / 3600
+    rng = np.random.default_rng(int(start))
+    values = baseline + drift * hours_into_cycle + rng.normal(0, noise, len(timestamps))
+    return timestamps, values.astype("float32")
+
+NS_PER_DAY = 86_400 * 10**9
+
+WORK_ORDER_COLUMNS = ["work_order_id", "asset_id", "event", "timestamp", "emergency", "work_type"]
+
+def generate_work_order_log(n_orders=10_000, n_assets=500, days=90, seed=0):
+    # One opened/assigned/completed event per order; the newest orders are
+    # still open. Every row carries the order's attributes, as exports do.
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp(datetime.today()).floor("s")
+    opened = end - pd.to_timedelta(rng.uniform(0, days * 86400, n_orders), unit="s")
+    opened = opened.sort_values()
+    assigned = opened + pd.to_timedelta(rng.exponential(2 * 3600, n_orders), unit="s")
+    completed = assigned + pd.to_timedelta(rng.exponential(20 * 3600, n_orders), unit="s")
+    is_open = completed > end
+
+    orders = pd.DataFrame({
+        "work_order_id": np.arange(n_orders),
+        "asset_id": rng.integers(0, n_assets, n_orders),
+        "emergency": rng.random(n_orders) < 0.12,
+        "work_type": np.where(rng.random(n_orders) < 0.45, "preventive", "corrective"),
+    })
+    events = [
+        orders.assign(event="opened", timestamp=opened),
+        orders[assigned <= end].assign(event="assigned", timestamp=assigned[assigned <= end]),
+        orders[~is_open].assign(event="completed", timestamp=completed[~is_open]),
+    ]
+    log = pd.concat(events, ignore_index=True).sort_values("timestamp", kind="stable")
+    return log[WORK_ORDER_COLUMNS].reset_index(drop=True)
+
+# Mean minutes an asset stays in each state, and how often it enters it
+STATE_MINUTES = {"run": 360, "stop": 60, "fault": 45}
+STATE_ODDS = {"run": 0.62, "stop": 0.3, "fault": 0.08}
+
+def generate_state_log(n_assets=60, days=8, seed=0):
+    # PLC-style run/stop/fault transitions per asset, oldest first
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp(datetime.today()).floor("s")
+    mean = sum(STATE_ODDS[s] * STATE_MINUTES[s] for s in availability.STATES)
+    per_asset = int(days * 1440 / mean * 1.5) + 10
+    codes = rng.choice(len(availability.STATES), (n_assets, per_asset), p=[STATE_ODDS[s] for s in availability.STATES])
+    minutes = rng.exponential(np.array([STATE_MINUTES[s] for s in availability.STATES])[codes])
+    # Offsets from the window start: the first transition is at 0
+    offsets = np.cumsum(minutes, axis=1) - minutes
+    keep = offsets < days * 1440
+    assets = np.broadcast_to(np.arange(n_assets)[:, None], codes.shape)
+    log = pd.DataFrame({
+        "asset_id": assets[keep],
+        "timestamp": end - pd.Timedelta(days=days) + pd.to_timedelta(offsets[keep].round(), unit="min"),
+        "state": np.asarray(availability.STATES)[codes[keep]],
+    })
+    return log.sort_values("timestamp", kind="stable").reset_index(drop=True)
+
+def iter_work_order_chunks(path, chunksize=None):
+    chunksize = chunksize or config.WORK_ORDER_CHUNK_ROWS
+    name = str(path).lower().removesuffix(".gz")
+    if name.endswith((".jsonl", ".json")):
+        reader = pd.read_json(path, lines=True, chunksize=chunksize, dtype=False)
+    else:
+        reader = pd.read_csv(
+            path, chunksize=chunksize, usecols=lambda c: c in WORK_ORDER_COLUMNS,
+            dtype={"event": "category", "work_type": "category"},
+        )
+    with reader:
+        yield from reader
+
+class WorkOrderAggregator:
+    # Running per-day counts from a work-order event log. Only the daily
+    # totals are kept, so memory is bounded by the chunk size and the number
+    # of days, never by the length of the log.
+    COUNTS = ["opened", "completed", "emergency", "preventive"]
+
+    def __init__(self):
+        self.daily = pd.DataFrame(columns=self.COUNTS, dtype="int64")
+        self.rows = 0
+
+    def update(self, chunk):
+        # A header-only file or a tail read with nothing new
+        if chunk.empty:
+            return self
+        day = pd.to_datetime(chunk["timestamp"], format="ISO8601").dt.floor("D")
+        opened = (chunk["event"] == "opened").to_numpy(dtype=bool)
+        completed = (chunk["event"] == "completed").to_numpy(dtype=bool)
+        preventive = (chunk["work_type"] == "preventive").to_numpy(dtype=bool)
+        emergency = chunk["emergency"]
+        if emergency.dtype != bool:
+            emergency = emergency.astype(str).str.lower().isin(["true", "1"])
+        emergency = emergency.to_numpy(dtype=bool)
+
+        # Bucket by day number with bincount rather than a groupby
+        day_number = day.dt.as_unit("ns").astype("int64").to_numpy() // NS_PER_DAY
+        first = day_number.min()
+        offset = day_number - first
+        counts = pd.DataFrame(
+            {name: np.bincount(offset, weights=mask).astype("int64") for name, mask in (
+                ("opened", opened),
+                ("completed", completed),
+                ("emergency", opened & emergency),
+                ("preventive", completed & preventive),
+            )},
+            index=pd.to_datetime((first + np.arange(offset.max() + 1)) * NS_PER_DAY),
+        )
+        self.daily = self.daily.add(counts, fill_value=0).astype("int64")
+        self.rows += len(chunk)
+        return self
+
+    def consume(self, path, chunksize=None):
+        for chunk in iter_work_order_chunks(path, chunksize):
+            self.update(chunk)
+        return self
+
+    def maintenance_frame(self, days=7, initial_backlog=0):
+        if self.daily.empty:
+            return pd.DataFrame(columns=["Date", "Completed Work Orders", "Pending Work Orders",
+                                         "Emergency Repairs", "Preventive Maintenance"])
+        full_range = pd.date_range(self.daily.index.min(), self.daily.index.max(), freq="D")
+        daily = self.daily.reindex(full_range, fill_value=0)
+        # Orders still open at the end of each day
+        pending = initial_backlog + daily["opened"].cumsum() - daily["completed"].cumsum()
+        frame = pd.DataFrame({
+            "Date": full_range.strftime("%Y-%m-%d"),
+            "Completed Work Orders": daily["completed"].to_numpy(),
+            "Pending Work Orders": pending.to_numpy(),
+            "Emergency Repairs": daily["emergency"].to_numpy(),
+            "Preventive Maintenance": daily["preventive"].to_numpy(),
+        })
+        return frame.tail(days).reset_index(drop=True) if days else frame
+
+def aggregate_work_order_log(path, chunksize=None, aggregator=None):
+    return (aggregator or WorkOrderAggregator()).consume(path, chunksize)
+
+def load_maintenance_history(path=None, chunksize=None):
+    # Full daily maintenance counts over the whole log, for period comparisons
+    path = path or config.WORK_ORDER_LOG
+    if path:
+        stat = os.stat(path)
+        version = f"log-{int(stat.st_mtime)}-{stat.st_size}"
+        build = lambda: aggregate_work_order_log(path, chunksize).maintenance_frame(days=None)
+    else:
+        version = f"local-{datetime.today():%Y%m%d}"
+        build = lambda: WorkOrderAggregator().update(generate_work_order_log()).maintenance_frame(days=None)
+
+    def load():
+        history = build()
+        history.attrs["data_version"] = version
+        return history
+    return CACHE.get_or_compute(("maintenance_history", version), load)
+
+def _order_events(chunk):
+    # Only opened/completed rows matter for reliability analytics, reduced
+    # to compact numeric columns
+    chunk = chunk[chunk["event"].isin(["opened", "completed"])]
+    emergency = chunk["emergency"]
+    if emergency.dtype != bool:
+        emergency = emergency.astype(str).str.lower().isin(["true", "1"])
+    return pd.DataFrame({
+        "work_order_id": chunk["work_order_id"].to_numpy(dtype="int64"),
+        "asset_id": chunk["asset_id"].to_numpy(dtype="int64"),
+        "completed": (chunk["event"] == "completed").to_numpy(dtype=bool),
+        "corrective": (chunk["work_type"] != "preventive").to_numpy(dtype=bool) | emergency.to_numpy(dtype=bool),
+        "timestamp": pd.to_datetime(chunk["timestamp"], format="ISO8601").dt.as_unit("ns").astype("int64").to_numpy(),
+    })
+
+def load_work_order_events(path=None, chunksize=None):
+    path = path or config.WORK_ORDER_LOG
+    if path:
+        stat = os.stat(path)
+        version = f"log-{int(stat.st_mtime)}-{stat.st_size}"
+        build = lambda: pd.concat(
+            [_order_events(chunk) for chunk in iter_work_order_chunks(path, chunksize)], ignore_index=True
+        )
+    else:
+        version = f"local-{datetime.today():%Y%m%d}"
+        build = lambda: _order_events(generate_work_order_log())
+
+    def load():
+        events = build()
+        events.attrs["data_version"] = version
+        return events
+    return CACHE.get_or_compute(("work_order_events", version), load)
+
+SITES = ["North Plant", "South Plant", "East Plant"]
+
+def asset_sites(asset_ids, sites=None):
+    # In production, replace this with a lookup in the asset register
+    sites = SITES if sites is None else sites
+    return np.asarray(sites)[np.asarray(asset_ids) % len(sites)]
+
+ASSET_TYPES = ["Chillers", "Compressors", "Generators", "Production Line"]
+ORDER_STATUSES = ["Open", "Completed"]
+
+def asset_types(asset_ids):
+    # In production, replace this with a lookup in the asset register
+    return np.asarray(ASSET_TYPES)[np.asarray(asset_ids) // len(SITES) % len(ASSET_TYPES)]
+
+def work_order_index(events):
+    # Site, asset type and order status bitmaps over the event table, built
+    # once per log version; filters gather only their rows from it
+    def build():
+        asset_ids = events["asset_id"].to_numpy()
+        order_ids = events["work_order_id"].to_numpy()
+        completed = np.isin(order_ids, order_ids[events["completed"].to_numpy()])
+        return BitmapIndex({
+            "site": asset_sites(asset_ids),
+            "asset_type": asset_types(asset_ids),
+            "status": np.asarray(ORDER_STATUSES)[completed.astype("int8")],
+        })
+    return CACHE.get_or_compute(("work_order_index", data_version(events)), build)
+
+# Fleet daily kWh per category and meters per category for interval data
+ENERGY_CATEGORIES = {
+    "Chillers": (4300, 40),
+    "Compressors": (3850, 40),
+    "Lighting": (1200, 20),
+}
+
+def generate_interval_energy(days=365, freq="15min", categories=None, seed=0):
+    # Wide interval readings (timestamps x meters, kWh per interval) plus a
+    # meter table mapping each column to its category and site
+    categories = categories or ENERGY_CATEGORIES
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp(datetime.today()).floor("D")
+    index = pd.date_range(end - pd.Timedelta(days=days), end, freq=freq, inclusive="left", name="timestamp")
+    per_day = int(pd.Timedelta("1D") / pd.Timedelta(freq))
+    hour = index.hour.to_numpy() + index.minute.to_numpy() / 60
+    season = 1 + 0.25 * np.cos(2 * np.pi * (index.dayofyear.to_numpy() - 200) / 365)
+    weekday = index.dayofweek.to_numpy() < 5
+
+    shapes = {
+        # Cooling load peaks mid-afternoon and follows the season
+        "Chillers": (1 + 0.6 * np.sin(np.pi * np.clip(hour - 6, 0, 14) / 14)) * season,
+        # Compressors follow production shifts
+        "Compressors": np.where(weekday & (hour >= 6) & (hour < 22), 1.3, 0.6),
+        "Lighting": np.where((hour >= 6) & (hour < 20), 1.5, 0.4),
+    }
+
+    columns, meter_rows = [], []
+    for category, (daily_kwh, n_meters) in categories.items():
+        shape = shapes.get(category, np.ones(len(index)))
+        shape = shape / shape.mean()
+        scale = daily_kwh / n_meters / per_day
+        meter_scale = rng.uniform(0.7, 1.3, n_meters)
+        meter_scale = meter_scale / meter_scale.mean()
+        noise = rng.normal(1, 0.08, (len(index), n_meters))
+        columns.append((shape[:, None] * scale * meter_scale[None, :] * noise).clip(min=0))
+        prefix = category[:2].upper()
+        meter_rows += [(f"{prefix}-{i + 1:02d}", category, SITES[i % len(SITES)]) for i in range(n_meters)]
+
+    meters = pd.DataFrame(meter_rows, columns=["meter_id", "category", "site"])
+    readings = pd.DataFrame(np.hstack(columns).astype("float32"), index=index, columns=meters["meter_id"])
+    readings.columns.name = None
+    return readings, meters
+
+def load_energy_intervals(snapshot_dir=None):
+    frames = snapshot.load_latest(snapshot_dir or config.SNAPSHOT_DIR)
+    if frames is not None and "energy_intervals" in frames and "meters" in frames:
+        version = data_version(frames["meters"])
+        return CACHE.get_or_compute(
+            ("energy_intervals", version),
+            lambda: (_indexed_intervals(frames["energy_intervals"], version), frames["meters"]),
+        )
+
+    version = f"local-{datetime.today():%Y%m%d}"
+    return CACHE.get_or_compute(
+        ("energy_intervals", version), lambda: _stamp_version(load_source_intervals(), version)
+    )
+
+def complete_days(readings):
+    # Drop the trailing day unless its final interval has arrived
+    if len(readings) < 2:
+        return readings.iloc[:0]
+    step = readings.index[-1] - readings.index[-2]
+    return readings[readings.index < (readings.index[-1] + step).floor("D")]
+
+@cached("data")
+def daily_totals(readings):
+    # Per-meter kWh for each complete day, shared by the sketches, anomaly
+    # detectors and rollups
+    return engine.period_sums(complete_days(readings), "D")
+
+def _indexed_intervals(intervals, version):
+    # Snapshots store the timestamp index as a plain column
+    readings = intervals.set_index("timestamp")
+    readings.attrs["data_version"] = version
+    return readings
+
+def load_source_intervals():
+    # In production, replace this with the meter data feed
+    return ingest.align_intervals(*generate_interval_energy())
+
+def load_source_data():
     # In production, replace this with real data loading
-    return generate_operations_data()
\ No newline at end of file
+    equipment_df, maintenance_df, energy_df = generate_operations_data()
+    if config.WORK_ORDER_LOG:
+        maintenance_df = aggregate_work_order_log(config.WORK_ORDER_LOG).maintenance_frame()
+    if config.STATE_LOG:
+        equipment_df = load_equipment_availability(config.STATE_LOG)
+    # Feeds arrive irregularly and with dropouts; everything downstream reads
+    # the aligned daily grid
+    return ingest.align_operations(equipment_df, maintenance_df, energy_df)
+
+def load_equipment_availability(path=None, days=7):
+    # Daily uptime per asset type from the state-change log; the tracker
+    # lives across refreshes and only reads transitions appended since
+    path = path or config.STATE_LOG
+    tracker = availability.get_tracker(path)
+    tracker.consume(path)
+    return availability.equipment_frame(tracker, asset_types, ASSET_TYPES, days)
+
+def data_version(df):
+    return df.attrs.get("data_version")
+
+def load_data(snapshot_dir=None):
+    # Sessions read the snapshot published by worker.py; without a worker
+    # running, fall back to loading in-process
+    frames = snapshot.load_latest(snapshot_dir or config.SNAPSHOT_DIR)
+    if frames is not None and all(name in frames for name in FRAME_NAMES):
+        dfs = tuple(frames[name] for name in FRAME_NAMES)
+        _restore_artifacts(data_version(dfs[0]))
+        return dfs
+
+    version = f"local-{datetime.today():%Y%m%d}"
+    if config.STATE_LOG and os.path.exists(config.STATE_LOG):
+        # Appended transitions change the equipment frame, so they start a
+        # new version rather than waiting for tomorrow's
+        version += f"-{os.stat(config.STATE_LOG).st_mtime_ns}"
+    _restore_artifacts(version)
+    return CACHE.get_or_compute(("data", version), lambda: _stamp_version(load_source_data(), version))
+
+def _restore_artifacts(version):
+    # Figures and KPIs precomputed by warmup.py for this version
+    restored = artifacts.restore_once(version, CACHE)
+    if restored:
+        metrics.incr("artifacts_restored", restored)
+
+def _stamp_version(dfs, version):
+    for df in dfs:
+        df.attrs["data_version"] = version
+    return dfs
\ No newline at end of file
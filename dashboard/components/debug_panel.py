@@ -0,0 +1,47 @@
+import streamlit as st
+import pandas as pd
+from utils import config, metrics
+from utils.cache import CACHE
+from components import alert_store, distributions, telemetry
+
+def debug_enabled():
+    return config.DEBUG or st.query_params.get("debug") == "1"
+
+def display_debug_panel():
+    if not debug_enabled():
+        return
+
+    with st.sidebar.expander("Debug", expanded=True):
+        stats = CACHE.stats()
+        st.markdown("**Cache**")
+        col1, col2 = st.columns(2)
+        col1.metric("Hits", stats["hits"])
+        col2.metric("Misses", stats["misses"])
+        col1.metric("Evictions", stats["evictions"])
+        col2.metric("Hit rate", f"{stats['hit_rate']:.0%}")
+        st.progress(
+            min(stats["resident_bytes"] / stats["max_bytes"], 1.0),
+            text=f"{stats['resident_bytes'] / 1024 ** 2:,.1f} / {stats['max_bytes'] / 1024 ** 2:,.0f} MB resident",
+        )
+        entries = CACHE.entries()
+        if entries:
+            st.dataframe(pd.DataFrame(entries), hide_index=True, use_container_width=True)
+
+        store = telemetry.get_store()
+        st.markdown("**Telemetry**")
+        st.caption(
+            f"{len(store.channels())} channels × {store.capacity:,} samples "
+            f"({store.hours:g} h at {store.hz:g} Hz), {store.nbytes / 1024 ** 2:,.1f} MB"
+        )
+
+        sketches = distributions.get_store()
+        st.markdown("**Quantile sketches**")
+        st.caption(f"{len(sketches):,} sketches, {sketches.nbytes / 1024:,.0f} KB")
+
+        alerts = alert_store.get_store()
+        st.markdown("**Alerts**")
+        st.caption(f"{len(alerts.active()):,} open of {len(alerts):,} tracked, {alerts.firings:,} firings merged")
+
+        process = metrics.snapshot()
+        st.markdown("**Process**")
+        st.json(process, expanded=False)
@@ -0,0 +1,92 @@
+import threading
+import pandas as pd
+from components import data
+from utils import engine
+from utils.sketch import QuantileSketch
+
+PERCENTILES = (0.5, 0.95, 0.99)
+UPTIME_COLUMNS = ["Chillers", "Compressors", "Generators", "Production Line"]
+
+class SketchStore:
+    # Quantile sketches per (metric, asset, month). Daily values are ingested
+    # once, past a per-metric high-water mark, and fleet or multi-month
+    # answers come from merging sketches rather than rescanning rows.
+    def __init__(self, relative_accuracy=0.005):
+        self.relative_accuracy = relative_accuracy
+        self._sketches = {}
+        self._high_water = {}
+        self._lock = threading.Lock()
+
+    def high_water(self, metric):
+        return self._high_water.get(metric)
+
+    def ingest_daily(self, metric, daily):
+        # daily: one row per day (DatetimeIndex), one column per asset
+        with self._lock:
+            mark = self._high_water.get(metric)
+            if mark is not None:
+                daily = daily[daily.index > mark]
+            if daily.empty:
+                return 0
+            months = daily.index.strftime("%Y-%m")
+            values = daily.to_numpy(dtype="float64")
+            for month in pd.unique(months):
+                block = values[months == month]
+                for column, asset in enumerate(daily.columns):
+                    key = (metric, asset, month)
+                    sketch = self._sketches.get(key)
+                    if sketch is None:
+                        sketch = self._sketches[key] = QuantileSketch(self.relative_accuracy)
+                    sketch.add(block[:, column])
+            self._high_water[metric] = daily.index.max()
+            return daily.size
+
+    def merged(self, metric, assets=None, months=None):
+        result = QuantileSketch(self.relative_accuracy)
+        with self._lock:
+            for (m, asset, month), sketch in self._sketches.items():
+                if m != metric or (assets is not None and asset not in assets) or (months is not None and month not in months):
+                    continue
+                result.merge(sketch)
+        return result
+
+    def percentiles(self, metric, assets=None, months=None, qs=PERCENTILES):
+        sketch = self.merged(metric, assets, months)
+        return dict(zip(qs, sketch.quantiles(qs)))
+
+    @property
+    def nbytes(self):
+        return sum(sketch.nbytes for sketch in self._sketches.values())
+
+    def __len__(self):
+        return len(self._sketches)
+
+_store = SketchStore()
+
+def get_store():
+    return _store
+
+def update_from_data(equipment_df, readings, store=None):
+    store = _store if store is None else store
+
+    # Energy: per-meter daily kWh, plus the fleet daily total as its own asset.
+    # Only complete days past the high-water mark are resampled
+    mark = store.high_water("meter_daily_kwh")
+    new = readings if mark is None else readings[readings.index >= mark + pd.Timedelta(days=1)]
+    complete = data.complete_days(new)
+    if not complete.empty:
+        daily = engine.period_sums(complete, "D")
+        store.ingest_daily("meter_daily_kwh", daily)
+        store.ingest_daily("fleet_daily_kwh", daily.sum(axis=1).to_frame("fleet"))
+
+    uptime = equipment_df.set_index(pd.to_datetime(equipment_df["Date"]))[UPTIME_COLUMNS]
+    store.ingest_daily("uptime_pct", uptime)
+    return store
+
+def fleet_percentiles(store=None):
+    store = _store if store is None else store
+    return {
+        "fleet_daily_kwh": store.percentiles("fleet_daily_kwh"),
+        "meter_daily_kwh": store.percentiles("meter_daily_kwh"),
+        "uptime_pct": store.percentiles("uptime_pct"),
+    }
@@ -0,0 +1,82 @@
+import pandas as pd
+import streamlit as st
+from datetime import datetime, timedelta
+from components import data
+from utils import coalesce
+from utils.export import WRITERS, export_file
+
+def display_export_filters():
+    today = datetime.today().date()
+    st.sidebar.subheader("Export")
+    st.sidebar.date_input(
+        "Date range", value=(today - timedelta(days=6), today), min_value=today - timedelta(days=365),
+        max_value=today, key="export_range", on_change=coalesce.debounce,
+    )
+    st.sidebar.multiselect(
+        "Sites", data.SITES, default=data.SITES, key="export_sites", on_change=coalesce.debounce,
+        help="Applies to exports with a site dimension (work orders, meter intervals)",
+    )
+    st.sidebar.multiselect(
+        "Asset types", data.ASSET_TYPES, default=data.ASSET_TYPES, key="export_asset_types",
+        on_change=coalesce.debounce, help="Applies to work-order reliability and exports",
+    )
+    st.sidebar.multiselect(
+        "Work-order status", data.ORDER_STATUSES, default=data.ORDER_STATUSES, key="export_statuses",
+        on_change=coalesce.debounce, help="Applies to work-order exports",
+    )
+
+def selected_filters():
+    today = datetime.today().date()
+    selected = st.session_state.get("export_range") or (today - timedelta(days=6), today)
+    # The date input holds a single date while a range is being picked
+    start, end = (selected[0], selected[-1]) if isinstance(selected, (tuple, list)) else (selected, selected)
+    sites = st.session_state.get("export_sites", data.SITES)
+    return pd.Timestamp(start), pd.Timestamp(end) + pd.Timedelta(days=1), list(sites)
+
+def work_order_filters():
+    # Bitmap index dimensions -> selected values, for data.work_order_index
+    return {
+        "site": list(st.session_state.get("export_sites", data.SITES)),
+        "asset_type": list(st.session_state.get("export_asset_types", data.ASSET_TYPES)),
+        "status": list(st.session_state.get("export_statuses", data.ORDER_STATUSES)),
+    }
+
+def daily_export(df, start, end):
+    dates = pd.to_datetime(df["Date"])
+    return df[(dates >= start) & (dates < end)]
+
+def work_order_export(events, start, end, filters):
+    # The index narrows by site, asset type and status; only those rows are
+    # gathered and checked against the date range
+    selected = data.work_order_index(events).select(events, **filters)
+    timestamps = selected["timestamp"].to_numpy()
+    selected = selected[(timestamps >= start.as_unit("ns").value) & (timestamps < end.as_unit("ns").value)]
+    asset_ids = selected["asset_id"].to_numpy()
+    return pd.DataFrame({
+        "work_order_id": selected["work_order_id"].to_numpy(),
+        "asset_id": asset_ids,
+        "site": data.asset_sites(asset_ids),
+        "asset_type": data.asset_types(asset_ids),
+        "event": pd.Categorical.from_codes(selected["completed"].to_numpy(dtype="int8"), ["opened", "completed"]),
+        "corrective": selected["corrective"].to_numpy(),
+        "timestamp": pd.to_datetime(selected["timestamp"].to_numpy(), unit="ns"),
+    })
+
+def interval_export(readings, meters, start, end, sites):
+    columns = meters["meter_id"] if "site" not in meters else meters.loc[meters["site"].isin(sites), "meter_id"]
+    window = readings.loc[(readings.index >= start) & (readings.index < end), list(columns)]
+    return window.reset_index()
+
+def download_buttons(label, name, build):
+    # The frame and file are only built when a button is clicked, on
+    # Streamlit's download thread rather than the script run
+    start, end, _ = selected_filters()
+    stem = f"{name}_{start:%Y%m%d}_{(end - pd.Timedelta(days=1)):%Y%m%d}"
+    st.markdown(f"**{label}**")
+    columns = st.columns(len(WRITERS))
+    for col, (fmt, (_, mime)) in zip(columns, WRITERS.items()):
+        with col:
+            st.download_button(
+                fmt.upper(), data=lambda fmt=fmt: export_file(build(), fmt), file_name=f"{stem}.{fmt}",
+                mime=mime, on_click="ignore", key=f"export_{name}_{fmt}", use_container_width=True,
+            )
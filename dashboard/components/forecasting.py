@@ -0,0 +1,106 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from components import data
+from utils import config
+from utils.cache import cached
+
+SEASON = 7
+# Smoothing weights tried for every series at once; each series keeps the
+# pair with the lowest one-step-ahead error over its history
+ALPHAS = (0.05, 0.1, 0.2, 0.35, 0.5)
+GAMMAS = (0.05, 0.15, 0.3)
+BETA = 0.1
+DAMPING = 0.98
+# Two-sided 80% band
+BAND_Z = 1.2816
+FLEET = "Fleet"
+
+def fit_holt_winters(values, horizon):
+    # Damped additive Holt-Winters with a weekly season for every column of
+    # a days x series matrix. The recursion steps through days; series and
+    # the parameter grid are array axes, so there is no per-series loop.
+    values = np.asarray(values, dtype="float64")
+    n_days, n_series = values.shape
+    grid_alpha, grid_gamma = (g.ravel()[:, None] for g in np.meshgrid(ALPHAS, GAMMAS, indexing="ij"))
+    shape = (len(grid_alpha), n_series)
+
+    first, second = np.nanmean(values[:SEASON], axis=0), np.nanmean(values[SEASON:2 * SEASON], axis=0)
+    level = np.broadcast_to(first, shape).copy()
+    trend = np.broadcast_to((second - first) / SEASON, shape).copy()
+    season = np.broadcast_to((values[:SEASON] - first)[:, None], (SEASON,) + shape).copy()
+    season = np.nan_to_num(season)
+    sse = np.zeros(shape)
+
+    for t in range(SEASON, n_days):
+        slot = t % SEASON
+        predicted = level + DAMPING * trend + season[slot]
+        # Missing days carry the model forward without updating it
+        error = np.nan_to_num(values[t] - predicted)
+        if t >= 2 * SEASON:
+            sse += error ** 2
+        level = level + DAMPING * trend + grid_alpha * error
+        trend = DAMPING * trend + grid_alpha * BETA * error
+        season[slot] += grid_gamma * error
+
+    best = np.argmin(sse, axis=0)
+    columns = np.arange(n_series)
+    level, trend, alpha = level[best, columns], trend[best, columns], grid_alpha[best, 0]
+    season = season[:, best, columns]
+    sigma = np.sqrt(sse[best, columns] / max(n_days - 2 * SEASON, 1))
+
+    steps = np.arange(1, horizon + 1)[:, None]
+    damped = np.cumsum(DAMPING ** steps, axis=0)
+    point = level + damped * trend + season[(n_days + steps[:, 0] - 1) % SEASON]
+    # Error variance grows with the horizon roughly as for simple smoothing
+    spread = BAND_Z * sigma * np.sqrt(1 + (steps - 1) * alpha ** 2)
+    return np.clip(point, 0, None), np.clip(point - spread, 0, None), np.clip(point + spread, 0, None)
+
+def fit_all(values, horizon, workers=None):
+    # Large fleets are split column-wise across processes; each block is
+    # still fitted as one matrix
+    values = np.asarray(values, dtype="float64")
+    workers = config.FORECAST_WORKERS if workers is None else workers
+    if workers <= 1 or values.shape[1] < config.FORECAST_PROCESS_MIN_SERIES:
+        return fit_holt_winters(values, horizon)
+    blocks = np.array_split(values, workers, axis=1)
+    with ProcessPoolExecutor(workers) as pool:
+        parts = list(pool.map(fit_holt_winters, blocks, [horizon] * len(blocks)))
+    return tuple(np.hstack(part) for part in zip(*parts))
+
+@cached("forecast")
+def energy_forecast(readings, meters, horizon=None):
+    # Next-days kWh for every meter, every category and the fleet, fitted
+    # together on the daily totals. Cached per data version, so a refit
+    # happens only when a new snapshot arrives.
+    horizon = config.FORECAST_DAYS if horizon is None else horizon
+    daily = data.daily_totals(readings)
+    if len(daily) < 3 * SEASON:
+        return None
+    categories = meters.set_index("meter_id")["category"].reindex(daily.columns)
+    by_category = daily.T.groupby(categories.to_numpy()).sum().T
+    by_category[FLEET] = daily.sum(axis=1)
+    series = pd.concat([daily, by_category], axis=1)
+
+    point, lower, upper = fit_all(series.to_numpy(), horizon)
+    dates = pd.date_range(daily.index[-1] + pd.Timedelta(days=1), periods=horizon, freq="D", name="Date")
+    n_meters = daily.shape[1]
+    result = {"history_end": daily.index[-1]}
+    for name, part in (("meters", slice(None, n_meters)), ("categories", slice(n_meters, None))):
+        result[name] = {
+            key: pd.DataFrame(values[:, part], index=dates, columns=series.columns[part])
+            for key, values in (("forecast", point), ("lower", lower), ("upper", upper))
+        }
+    return result
+
+def category_summary(result):
+    # Forecast kWh over the horizon per category, with the average day
+    categories = result["categories"]
+    summary = pd.DataFrame({
+        "forecast_kwh": categories["forecast"].sum(),
+        "avg_daily_kwh": categories["forecast"].mean(),
+        "peak_day_upper_kwh": categories["upper"].max(),
+    })
+    summary.index.name = "category"
+    return summary.reset_index()
@@ -0,0 +1,68 @@
+import pandas as pd
+from utils import resample
+
+GAP_COLUMN = "Gap"
+
+# Increments add up within a day; levels are time-weighted and a reading
+# stands in for at most one day after it arrives
+SUM = {"agg": "sum"}
+LEVEL = {"agg": "time_mean", "hold": "1D"}
+
+POLICIES = {
+    "Chillers": LEVEL,
+    "Compressors": LEVEL,
+    "Generators": LEVEL,
+    "Production Line": LEVEL,
+    "Completed Work Orders": SUM,
+    "Pending Work Orders": LEVEL,
+    "Emergency Repairs": SUM,
+    "Preventive Maintenance": SUM,
+    "Chillers (kWh)": SUM,
+    "Compressors (kWh)": SUM,
+    "Lighting (kWh)": SUM,
+    "Total (kWh)": SUM,
+}
+INTERVAL_POLICIES = {"default": SUM}
+
+def align_daily(df, end=None):
+    # One row per calendar day from the first reading through `end`, with
+    # GAP_COLUMN set on days where any metric had no readings
+    frame = df.drop(columns=[GAP_COLUMN], errors="ignore")
+    frame = frame.set_index(pd.DatetimeIndex(pd.to_datetime(frame.pop("Date"), format="ISO8601"), name="Date"))
+    values, gaps = resample.to_grid(frame, "D", POLICIES, end=end)
+    # Whole-number metrics keep their dtype unless a gap made them NaN
+    for column, dtype in frame.dtypes.items():
+        if dtype.kind in "iu" and values[column].notna().all():
+            values[column] = values[column].astype(dtype)
+    aligned = values.reset_index()
+    aligned["Date"] = aligned["Date"].dt.strftime("%Y-%m-%d")
+    aligned[GAP_COLUMN] = gaps.any(axis=1).to_numpy()
+    return aligned
+
+def align_operations(equipment_df, maintenance_df, energy_df, end=None):
+    # The grid runs to today, so a feed that stopped shows up as gap days
+    # rather than an older last row
+    end = pd.Timestamp.today().normalize() if end is None else end
+    return tuple(align_daily(df, end) for df in (equipment_df, maintenance_df, energy_df))
+
+def align_intervals(readings, meters, freq="15min"):
+    # Meter kWh onto a uniform interval grid; missing intervals stay NaN
+    values, _ = resample.to_grid(readings, freq, INTERVAL_POLICIES)
+    values = values.astype(readings.dtypes.iloc[0])
+    values.columns.name = readings.columns.name
+    return values, meters
+
+def gap_days(df):
+    if GAP_COLUMN not in df:
+        return []
+    return df.loc[df[GAP_COLUMN].astype(bool), "Date"].tolist()
+
+def latest(df, column):
+    # Most recent known value and the day it is from; sums are NaN on gap
+    # days and levels are only held for a day, so this skips the dropouts
+    valid = df[column].notna()
+    if not valid.any():
+        return None, None
+    row = df[valid].iloc[-1]
+    value = row[column]
+    return int(value) if float(value).is_integer() else value, row["Date"]
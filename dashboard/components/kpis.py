@@ -0,0 +1,72 @@
+from components import ingest
+from utils import engine
+from utils.cache import cached
+
+TARGET_ENERGY = 9500
+COST_PER_KWH = 0.12
+
+@cached("kpis")
+def status_kpis(equipment_df, maintenance_df, energy_df):
+    # Latest known value of each KPI; as_of records the day it came from,
+    # which is earlier than the last grid day when the feed has dropped out
+    sources = {
+        "chiller_uptime": (equipment_df, "Chillers"),
+        "compressor_uptime": (equipment_df, "Compressors"),
+        "emergency_repairs": (maintenance_df, "Emergency Repairs"),
+        "daily_energy": (energy_df, "Total (kWh)"),
+    }
+    status, as_of = {}, {}
+    for kpi, (df, column) in sources.items():
+        status[kpi], day = ingest.latest(df, column)
+        if day is not None and day != df["Date"].iloc[-1]:
+            as_of[kpi] = day
+    status["as_of"] = as_of
+    return status
+
+@cached("kpis")
+def maintenance_kpis(maintenance_df):
+    totals = engine.column_aggregates(maintenance_df, {
+        "Completed Work Orders": "sum",
+        "Pending Work Orders": "sum",
+        "Emergency Repairs": "sum",
+        "Preventive Maintenance": "sum",
+    })
+    completed = totals["Completed Work Orders"]
+    pending = totals["Pending Work Orders"]
+    emergency = totals["Emergency Repairs"]
+    preventive = totals["Preventive Maintenance"]
+    efficiency = round((completed - emergency) / completed * 100) if completed > 0 else 0
+    return {
+        "completed": completed,
+        "pending": pending,
+        "emergency": emergency,
+        "preventive": preventive,
+        "efficiency": efficiency,
+    }
+
+@cached("kpis")
+def energy_kpis(energy_df, target_energy=TARGET_ENERGY):
+    avg_energy = engine.column_aggregates(energy_df, {"Total (kWh)": "mean"})["Total (kWh)"]
+    daily_savings = (target_energy - avg_energy) * COST_PER_KWH if avg_energy < target_energy else 0
+    return {
+        "target_energy": target_energy,
+        "avg_energy": avg_energy,
+        "cost_per_kwh": COST_PER_KWH,
+        "daily_savings": daily_savings,
+    }
+
+def tariff_energy_kpis(energy_df, costs, target_energy=TARGET_ENERGY):
+    # Time-of-use savings and effective rate from tariff.recent_cost_summary
+    # replace the flat-rate figures, as on the energy card
+    summary = dict(energy_kpis(energy_df, target_energy))
+    if costs is not None:
+        summary["daily_savings"] = max(costs["avg_daily_savings"], 0)
+        summary["cost_per_kwh"] = costs["effective_rate"]
+    return summary
+
+def compute_kpis(equipment_df, maintenance_df, energy_df):
+    return {
+        "status": status_kpis(equipment_df, maintenance_df, energy_df),
+        "maintenance": maintenance_kpis(maintenance_df),
+        "energy": energy_kpis(energy_df),
+    }
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from components import charts
+from utils import config, metrics
+from utils.payload import date_axis, typed_array
+
+class LiveChart:
+    # Figure state kept per session so a tick only appends the new readings
+    def __init__(self, builder, window=None):
+        self.builder = getattr(builder, "uncached", builder)
+        self.window = window
+        self.figure = None
+        self.signature = None
+        self.first_date = None
+        self.last_date = None
+        self.rows_seen = 0
+        self.dates = None
+        self.values = {}
+        self.full_redraws = 0
+        self.appended_points = 0
+        self.revised_points = 0
+
+    def update(self, df, date_range=None):
+        signature = (date_range, tuple(c for c in df.columns if c != "Date"))
+        if self.figure is None or signature != self.signature or not self._extends(df):
+            self._redraw(df, signature)
+        else:
+            self._apply(df)
+        return self.figure
+
+    def _extends(self, df):
+        # A backfill, rows dropped or a new range start moves the dates, which
+        # needs a full redraw; revised values on the same dates are patched
+        if len(df) < self.rows_seen or self.rows_seen == 0:
+            return False
+        dates = df["Date"]
+        return dates.iloc[0] == self.first_date and dates.iloc[self.rows_seen - 1] == self.last_date
+
+    def _redraw(self, df, signature):
+        visible = df.tail(self.window) if self.window else df
+        self.figure = go.Figure(self.builder(visible))
+        self.signature = signature
+        self.first_date = df["Date"].iloc[0]
+        self.last_date = df["Date"].iloc[-1]
+        self.rows_seen = len(df)
+        self.dates = visible["Date"].to_numpy()
+        traced = {trace.name for trace in self.figure.data}
+        self.values = {column: visible[column].to_numpy() for column in visible.columns if column in traced}
+        self.full_redraws += 1
+        metrics.incr("live_full_redraws")
+
+    def _apply(self, df):
+        # Re-read the drawn points as well as the new rows: a revised day
+        # (the latest one usually, as its readings arrive) is patched in place
+        drawn = df.iloc[self.rows_seen - len(self.dates):self.rows_seen]
+        new_rows = df.iloc[self.rows_seen:]
+        revised = 0
+        for column, values in self.values.items():
+            current = drawn[column].to_numpy()
+            changed = ~((current == values) | (pd.isna(current) & pd.isna(values)))
+            if changed.any():
+                self.values[column] = current
+                revised += int(changed.sum())
+        if new_rows.empty and not revised:
+            return
+
+        self.dates = np.concatenate([self.dates, new_rows["Date"].to_numpy()])
+        for column in self.values:
+            self.values[column] = np.concatenate([self.values[column], new_rows[column].to_numpy()])
+        if self.window:
+            self.dates = self.dates[-self.window:]
+            self.values = {column: values[-self.window:] for column, values in self.values.items()}
+
+        x = {"x": None, "x0": None, "dx": None, **date_axis(self.dates)}
+        with self.figure.batch_update():
+            for trace in self.figure.data:
+                if trace.name in self.values:
+                    trace.update(**x)
+                    trace.y = typed_array(self.values[trace.name])
+
+        if not new_rows.empty:
+            self.last_date = new_rows["Date"].iloc[-1]
+            self.rows_seen += len(new_rows)
+            self.appended_points += len(new_rows)
+            metrics.incr("live_appended_points", len(new_rows))
+        if revised:
+            self.revised_points += revised
+            metrics.incr("live_revised_points", revised)
+
+def _session_chart(key, builder):
+    live = st.session_state.setdefault("live_charts", {})
+    if key not in live:
+        live[key] = LiveChart(builder, window=config.LIVE_WINDOW_POINTS)
+    return live[key]
+
+def live_equipment_uptime_chart(equipment_df, date_range=None):
+    return _session_chart("equipment_uptime", charts.create_equipment_uptime_chart).update(equipment_df, date_range)
+
+def live_energy_consumption_chart(energy_df, date_range=None):
+    return _session_chart("energy_consumption", charts.create_energy_consumption_chart).update(energy_df, date_range)
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+from utils.cache import cached
+
+NS_PER_HOUR = 3600 * 10**9
+BACKLOG_BUCKETS = [
+    ("<1 day", 0),
+    ("1-3 days", 24),
+    ("3-7 days", 72),
+    ("1-2 weeks", 168),
+    ("2-4 weeks", 336),
+    (">4 weeks", 672),
+]
+
+def _orders(events):
+    # One row per work order: when it was opened and, if it was, completed
+    opened = events[~events["completed"]]
+    completed = events[events["completed"]]
+    order_ids = opened["work_order_id"].to_numpy()
+    sort = np.argsort(order_ids, kind="stable")
+    order_ids = order_ids[sort]
+
+    completed_ids = completed["work_order_id"].to_numpy()
+    position = np.searchsorted(order_ids, completed_ids)
+    # Completions whose open falls outside the events (a window starting
+    # mid-history, one site's selection) have no order to close
+    matched = position < len(order_ids)
+    matched[matched] = order_ids[position[matched]] == completed_ids[matched]
+
+    completed_at = np.full(len(order_ids), -1, dtype="int64")
+    completed_at[position[matched]] = completed["timestamp"].to_numpy()[matched]
+    return (
+        opened["asset_id"].to_numpy()[sort],
+        opened["timestamp"].to_numpy()[sort],
+        completed_at,
+        opened["corrective"].to_numpy()[sort],
+    )
+
+def _per_asset_mean(codes, values, n_assets):
+    totals = np.bincount(codes, weights=values, minlength=n_assets)
+    counts = np.bincount(codes, minlength=n_assets)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, totals / counts, np.nan), counts
+
+@cached("reliability")
+def compute_reliability(events):
+    if events.empty:
+        return None
+    asset_ids, opened_at, completed_at, corrective = _orders(events)
+    assets, codes = np.unique(asset_ids, return_inverse=True)
+    n_assets = len(assets)
+    # Analytics are relative to the newest event, not the wall clock, so the
+    # result is fixed for a given data version
+    now = events["timestamp"].max()
+
+    # Mean time to repair: corrective orders that have been completed
+    repaired = corrective & (completed_at >= 0)
+    repair_hours = (completed_at[repaired] - opened_at[repaired]) / NS_PER_HOUR
+    mttr, _ = _per_asset_mean(codes[repaired], repair_hours, n_assets)
+
+    # Mean time between failures: gaps between consecutive corrective orders
+    # on the same asset, found by sorting on (asset, opened)
+    failure_codes = codes[corrective]
+    failure_times = opened_at[corrective]
+    order = np.lexsort((failure_times, failure_codes))
+    failure_codes, failure_times = failure_codes[order], failure_times[order]
+    same_asset = failure_codes[1:] == failure_codes[:-1]
+    gaps = np.diff(failure_times)[same_asset] / NS_PER_HOUR
+    mtbf, _ = _per_asset_mean(failure_codes[1:][same_asset], gaps, n_assets)
+    failures = np.bincount(failure_codes, minlength=n_assets)
+
+    # Backlog: orders still open, bucketed by age
+    open_age_hours = (now - opened_at[completed_at < 0]) / NS_PER_HOUR
+    edges = np.array([edge for _, edge in BACKLOG_BUCKETS], dtype="float64")
+    bucket = np.searchsorted(edges, open_age_hours, side="right") - 1
+    backlog = pd.DataFrame({
+        "Age": [label for label, _ in BACKLOG_BUCKETS],
+        "Open Work Orders": np.bincount(bucket, minlength=len(edges)),
+    })
+
+    per_asset = pd.DataFrame({
+        "asset_id": assets,
+        "failures": failures,
+        "mttr_hours": mttr,
+        "mtbf_hours": mtbf,
+    })
+    return {
+        "mttr_hours": float(repair_hours.mean()) if len(repair_hours) else float("nan"),
+        "mtbf_hours": float(np.nanmean(mtbf)) if np.isfinite(mtbf).any() else float("nan"),
+        "open_orders": int(len(open_age_hours)),
+        "oldest_open_days": float(open_age_hours.max() / 24) if len(open_age_hours) else 0.0,
+        "assets": n_assets,
+        "per_asset": per_asset,
+        "backlog": backlog,
+    }
@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+from components import data, kpis
+from utils.cache import cached
+
+# How each KPI rolls up over a period and which direction is good
+KPIS = {
+    "emergency_repairs": {"label": "Emergency repairs", "agg": "sum", "good": "down"},
+    "completed_work_orders": {"label": "Completed work orders", "agg": "sum", "good": "up"},
+    "pending_work_orders": {"label": "Pending work orders", "agg": "mean", "good": "down"},
+    "preventive_maintenance": {"label": "Preventive maintenance", "agg": "sum", "good": "up"},
+    "daily_energy": {"label": "Energy consumption", "agg": "mean", "good": "down"},
+    "chiller_uptime": {"label": "Chiller uptime", "agg": "mean", "good": "up"},
+    "compressor_uptime": {"label": "Compressor uptime", "agg": "mean", "good": "up"},
+}
+
+PERIODS = {
+    "week": (7, "this week", "last week"),
+    "month": (30, "this month", "last month"),
+    "year": (365, "this year", "last year"),
+}
+
+class KpiRollups:
+    # Prefix sums over a continuous daily KPI table. Any period's sum or mean
+    # is two lookups, so comparisons cost the same over years of history as
+    # over a week.
+    def __init__(self, daily):
+        daily = daily.sort_index()
+        full_range = pd.date_range(daily.index.min(), daily.index.max(), freq="D")
+        daily = daily.reindex(full_range)
+        values = daily.to_numpy(dtype="float64")
+        zeros = np.zeros((1, values.shape[1]))
+        self.columns = list(daily.columns)
+        self.first_day = full_range[0]
+        self.last_day = full_range[-1]
+        self.prefix = np.vstack([zeros, np.nancumsum(values, axis=0)])
+        self.counts = np.vstack([zeros, np.cumsum(~np.isnan(values), axis=0)])
+
+    @property
+    def nbytes(self):
+        # For the cache's byte budget
+        return int(self.prefix.nbytes + self.counts.nbytes)
+
+    def _position(self, day):
+        return (pd.Timestamp(day).normalize() - self.first_day).days + 1
+
+    def window(self, end, days):
+        # Sum and count of each KPI over the `days` days ending at `end`
+        stop = self._position(end)
+        start = stop - days
+        if start < 0 or stop > len(self.prefix) - 1:
+            return None, None
+        return self.prefix[stop] - self.prefix[start], self.counts[stop] - self.counts[start]
+
+    def compare(self, period="week", end=None):
+        days = PERIODS[period][0]
+        end = self.last_day if end is None else pd.Timestamp(end)
+        current_sum, current_count = self.window(end, days)
+        previous_sum, previous_count = self.window(end - pd.Timedelta(days=days), days)
+        if current_sum is None or previous_sum is None:
+            return None
+
+        rows = []
+        for i, kpi in enumerate(self.columns):
+            spec = KPIS[kpi]
+            if not current_count[i] or not previous_count[i]:
+                continue
+            if spec["agg"] == "sum":
+                current, previous = current_sum[i], previous_sum[i]
+            else:
+                current, previous = current_sum[i] / current_count[i], previous_sum[i] / previous_count[i]
+            delta = current - previous
+            rows.append({
+                "kpi": kpi,
+                "period": period,
+                "current": current,
+                "previous": previous,
+                "delta": delta,
+                "pct_change": delta / previous * 100 if previous else np.nan,
+            })
+        return pd.DataFrame(rows)
+
+def kpi_daily(equipment_df, maintenance_history, readings):
+    maintenance = maintenance_history.set_index(pd.to_datetime(maintenance_history["Date"]))
+    uptime = equipment_df.set_index(pd.to_datetime(equipment_df["Date"]))
+    energy = data.daily_totals(readings).sum(axis=1)
+    return pd.concat({
+        "emergency_repairs": maintenance["Emergency Repairs"],
+        "completed_work_orders": maintenance["Completed Work Orders"],
+        "pending_work_orders": maintenance["Pending Work Orders"],
+        "preventive_maintenance": maintenance["Preventive Maintenance"],
+        "daily_energy": energy,
+        "chiller_uptime": uptime["Chillers"],
+        "compressor_uptime": uptime["Compressors"],
+    }, axis=1)
+
+@cached("rollups")
+def build_rollups(equipment_df, maintenance_history, readings):
+    return KpiRollups(kpi_daily(equipment_df, maintenance_history, readings))
+
+def comparisons(equipment_df, maintenance_history, readings, end=None):
+    # Week, month and year deltas for every KPI. Periods end yesterday by
+    # default so a partly recorded today doesn't drag "this week" down.
+    end = pd.Timestamp.today().normalize() - pd.Timedelta(days=1) if end is None else pd.Timestamp(end)
+    # Resolved before the cache lookup so the end date is part of the key
+    return _comparisons(equipment_df, maintenance_history, readings, end)
+
+@cached("rollups")
+def _comparisons(equipment_df, maintenance_history, readings, end):
+    rollups = build_rollups(equipment_df, maintenance_history, readings)
+    tables = [rollups.compare(period, end) for period in PERIODS]
+    tables = [table for table in tables if table is not None and not table.empty]
+    if not tables:
+        return pd.DataFrame(columns=["kpi", "period", "current", "previous", "delta", "pct_change"])
+    return pd.concat(tables, ignore_index=True)
+
+def comparison_sentences(table, min_change=5.0):
+    # Split notable changes into good news and things to watch
+    positive, watch = [], []
+    for row in table.itertuples():
+        if not np.isfinite(row.pct_change) or abs(row.pct_change) < min_change:
+            continue
+        spec = KPIS[row.kpi]
+        direction = "increased" if row.delta > 0 else "reduced"
+        text = f"{spec['label']} {direction} by {abs(row.pct_change):.0f}% {PERIODS[row.period][1]}"
+        good = (row.delta > 0) == (spec["good"] == "up")
+        (positive if good else watch).append((abs(row.pct_change), text))
+    return positive, watch
+
+def status_deltas(table, period="week"):
+    # Delta text per status card KPI, with whether the change is good
+    deltas = {}
+    for row in table[table["period"] == period].itertuples():
+        if not np.isfinite(row.delta):
+            continue
+        spec = KPIS[row.kpi]
+        good = (row.delta > 0) == (spec["good"] == "up")
+        arrow = "▲" if row.delta > 0 else "▼" if row.delta < 0 else "■"
+        # A change from zero has no percentage; show the absolute change
+        change = f"{abs(row.pct_change):.1f}%" if np.isfinite(row.pct_change) else f"{abs(row.delta):,.0f}"
+        deltas[row.kpi] = {"text": f"{arrow} {change} vs {PERIODS[period][2]}", "good": good or row.delta == 0}
+    return deltas
+
+def energy_vs_target(readings):
+    daily = data.daily_totals(readings).sum(axis=1)
+    if daily.empty:
+        return None
+    return (daily.iloc[-1] / kpis.TARGET_ENERGY - 1) * 100
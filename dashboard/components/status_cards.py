@@ -1,4 +1,4 @@
-import streamlit as st
+from components import cards, kpis, telemetry
 
 def get_status_class(value, thresholds, reverse=False):
     if reverse:
@@ -16,20 +16,20 @@ def get_status_class(value, thresholds, reverse=False):
         else:
             return "critical"
 
-def create_status_card(value, label, target, thresholds, reverse=False):
-    status_class = get_status_class(value, thresholds, reverse)
-    return f"""
-    <div class="summary-card">
-        <div class="metric-value {status_class}">{value}{'%' if '%' in label else ''}</div>
-        <div class="metric-label">{label}</div>
-        <div style="text-align: center; margin-top: 10px;">
-            <small>Target: {target}</small>
-        </div>
-    </div>
-    """
+def create_status_card(value, label, target, thresholds, reverse=False, status_value=None, delta=None, as_of=None):
+    if value is None:
+        return cards.status_card("n/a", label, f"{target} · no data", "warning")
+    # status_value lets a formatted display value be classified by its number
+    status_class = get_status_class(value if status_value is None else status_value, thresholds, reverse)
+    # A stale value says which day it is from
+    if as_of is not None:
+        target = f"{target} · as of {as_of}"
+    return cards.status_card(f"{value}{'%' if '%' in label else ''}", label, target, status_class, delta)
 
-def display_status_cards(equipment_df, maintenance_df, energy_df):
-    col1, col2, col3, col4 = st.columns(4)
+def display_status_cards(equipment_df, maintenance_df, energy_df, deltas=None):
+    status = kpis.status_kpis(equipment_df, maintenance_df, energy_df)
+    deltas = deltas or {}
+    as_of = status["as_of"]
     
     # Define thresholds for each card
     thresholds = {
@@ -39,26 +39,35 @@ def display_status_cards(equipment_df, maintenance_df, energy_df):
         "energy": {"normal": 9500, "warning": 10000}
     }
     
-    with col1:
-        value = equipment_df["Chillers"].iloc[-1]
-        st.markdown(create_status_card(
-            value, "Chiller Uptime", ">95%", thresholds["chillers"]
-        ), unsafe_allow_html=True)
-    
-    with col2:
-        value = equipment_df["Compressors"].iloc[-1]
-        st.markdown(create_status_card(
-            value, "Compressor Uptime", ">95%", thresholds["compressors"]
-        ), unsafe_allow_html=True)
-    
-    with col3:
-        value = maintenance_df["Emergency Repairs"].iloc[-1]
-        st.markdown(create_status_card(
-            value, "Emergency Repairs", "<2/day", thresholds["emergency"], reverse=True
-        ), unsafe_allow_html=True)
+    cards.render_grid([
+        create_status_card(
+            status["chiller_uptime"], "Chiller Uptime", ">95%", thresholds["chillers"], delta=deltas.get("chiller_uptime"),
+            as_of=as_of.get("chiller_uptime")
+        ),
+        create_status_card(
+            status["compressor_uptime"], "Compressor Uptime", ">95%", thresholds["compressors"], delta=deltas.get("compressor_uptime"),
+            as_of=as_of.get("compressor_uptime")
+        ),
+        create_status_card(
+            status["emergency_repairs"], "Emergency Repairs", "<2/day", thresholds["emergency"], reverse=True, delta=deltas.get("emergency_repairs"),
+            as_of=as_of.get("emergency_repairs")
+        ),
+        create_status_card(
+            status["daily_energy"], "Daily Energy Usage", "<9,500 kWh", thresholds["energy"], reverse=True, delta=deltas.get("daily_energy"),
+            as_of=as_of.get("daily_energy")
+        ),
+    ], columns=4)
+
+def display_sensor_cards(store=None):
+    store = store or telemetry.get_store()
+    sensor_cards = []
     
-    with col4:
-        value = energy_df["Total (kWh)"].iloc[-1]
-        st.markdown(create_status_card(
-            value, "Daily Energy Usage", "<9,500 kWh", thresholds["energy"], reverse=True
-        ), unsafe_allow_html=True)
\ No newline at end of file
+    for channel, spec in telemetry.CHANNELS.items():
+        _, value = store.latest(channel)
+        if value is None:
+            continue
+        sensor_cards.append(create_status_card(
+            f"{value:,.1f} {spec['unit']}", spec["label"], spec["target"], spec["thresholds"], reverse=spec["reverse"],
+            status_value=value
+        ))
+    cards.render_grid(sensor_cards, columns=len(telemetry.CHANNELS))
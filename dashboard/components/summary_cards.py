@@ -1,148 +1,193 @@
+import html
+import math
 import streamlit as st
 import pandas as pd
+from components import cards, forecasting, kpis
 
-def display_maintenance_summary(maintenance_df):
-    completed = maintenance_df["Completed Work Orders"].sum()
-    pending = maintenance_df["Pending Work Orders"].sum()
-    emergency = maintenance_df["Emergency Repairs"].sum()
-    preventive = maintenance_df["Preventive Maintenance"].sum()
-    efficiency = round((completed - emergency) / completed * 100) if completed > 0 else 0
-    
+SAMPLE_ALERTS = [
+    {"equipment": "Compressor #7", "issue": "Temperature exceeding threshold", 
+     "status": "High", "duration": "4 hours", "action": "Inspect cooling system"},
+    {"equipment": "Chiller #3", "issue": "Low refrigerant pressure", 
+     "status": "Medium", "duration": "8 hours", "action": "Check for leaks"},
+    {"equipment": "Generator #2", "issue": "Battery voltage low", 
+     "status": "Medium", "duration": "12 hours", "action": "Test and replace battery"},
+    {"equipment": "Production Line B", "issue": "Vibration levels increasing", 
+     "status": "High", "duration": "2 days", "action": "Schedule bearing inspection"}
+]
+
+MAINTENANCE_EFFICIENCY = (
+    '<div style="margin-top: 20px; text-align: center;">'
+    '<div class="metric-value {status_class}">{efficiency}%</div>'
+    '<div class="metric-label">Planned Maintenance Efficiency</div>'
+    '<div class="card-target"><small>Target: &gt;80%</small></div></div>'
+)
+
+ENERGY_SAVINGS = (
+    '<div style="margin-top: 15px; background: #dcfce7; padding: 15px; border-radius: 8px; text-align: center;">'
+    '<div style="font-size: 1.5rem; font-weight: bold;">{savings}</div>'
+    '<div>Estimated Daily Savings</div>'
+    '<div style="font-size: 0.8rem; margin-top: 5px;">{rate_note}</div></div>'
+)
+
+ALERT_TABLE = (
+    '<table class="alert-table"><thead><tr><th>Equipment</th><th>Issue</th><th>Status</th>'
+    '<th>Duration</th><th>Action Required</th></tr></thead><tbody>{rows}</tbody></table>'
+)
+ALERT_ROW = (
+    '<tr><td><strong>{equipment}</strong></td><td>{issue}</td>'
+    '<td class="{status_class}">{status}{flapping}</td><td>{duration}{firings}</td><td>{action}</td></tr>'
+)
+FIRINGS = "<br><small>{:,} firings</small>"
+
+def maintenance_summary_html(maintenance_df):
+    summary = kpis.maintenance_kpis(maintenance_df)
+    efficiency = summary["efficiency"]
     status_class = "normal" if efficiency >= 80 else "warning" if efficiency >= 70 else "critical"
     
-    html_content = f"""
-    <div class="summary-card">
-        <div style="font-size: 1.2rem; text-align: center; font-weight: bold; margin-bottom: 15px;">
-            Weekly Maintenance Summary
-        </div>
-        <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
-            <span>Completed:</span>
-            <span style="font-weight: bold;">{completed}</span>
-        </div>
-        <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
-            <span>Pending:</span>
-            <span style="font-weight: bold;">{pending}</span>
-        </div>
-        <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
-            <span>Emergency:</span>
-            <span style="font-weight: bold; color: #ef4444;">{emergency}</span>
-        </div>
-        <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
-            <span>Preventive:</span>
-            <span style="font-weight: bold;">{preventive}</span>
-        </div>
-        <div style="margin-top: 20px; text-align: center;">
-            <div class="metric-value {status_class}">{efficiency}%</div>
-            <div class="metric-label">Planned Maintenance Efficiency</div>
-            <div style="text-align: center; margin-top: 10px;">
-                <small>Target: >80%</small>
-            </div>
-        </div>
-    </div>
-    """
-    
-    st.markdown(html_content, unsafe_allow_html=True)
+    body = "".join([
+        cards.row("Completed:", summary["completed"]),
+        cards.row("Pending:", summary["pending"]),
+        cards.row("Emergency:", summary["emergency"], value_style="color: #ef4444;"),
+        cards.row("Preventive:", summary["preventive"]),
+        MAINTENANCE_EFFICIENCY.format_map({"status_class": status_class, "efficiency": efficiency}),
+    ])
+    return cards.panel(body, heading="Weekly Maintenance Summary")
 
-def display_energy_summary(energy_df):
-    avg_energy = energy_df["Total (kWh)"].mean()
-    target_energy = 9500
-    cost_per_kwh = 0.12
-    daily_savings = (target_energy - avg_energy) * cost_per_kwh if avg_energy < target_energy else 0
-    
-    html_content = f"""
-    <div class="summary-card" style="margin-top: 20px;">
-        <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
-            <span>Target Daily Usage:</span>
-            <span style="font-weight: bold;">{target_energy:,.0f} kWh</span>
-        </div>
-        <div style="display: flex; justify-content: space-between; margin-bottom: 10px;">
-            <span>Avg. Daily Usage:</span>
-            <span style="font-weight: bold;">{avg_energy:,.0f} kWh</span>
-        </div>
-        <div style="margin-top: 15px; background: #dcfce7; padding: 15px; border-radius: 8px; text-align: center;">
-            <div style="font-size: 1.5rem; font-weight: bold;">${daily_savings:,.2f}</div>
-            <div>Estimated Daily Savings</div>
-            <div style="font-size: 0.8rem; margin-top: 5px;">Based on ${cost_per_kwh}/kWh</div>
-        </div>
-    </div>
-    """
-    
-    st.markdown(html_content, unsafe_allow_html=True)
-
-def display_alerts_table():
-    alerts = [
-        {"equipment": "Compressor #7", "issue": "Temperature exceeding threshold", 
-         "status": "High", "duration": "4 hours", "action": "Inspect cooling system"},
-        {"equipment": "Chiller #3", "issue": "Low refrigerant pressure", 
-         "status": "Medium", "duration": "8 hours", "action": "Check for leaks"},
-        {"equipment": "Generator #2", "issue": "Battery voltage low", 
-         "status": "Medium", "duration": "12 hours", "action": "Test and replace battery"},
-        {"equipment": "Production Line B", "issue": "Vibration levels increasing", 
-         "status": "High", "duration": "2 days", "action": "Schedule bearing inspection"}
+def display_maintenance_summary(maintenance_df):
+    st.markdown(maintenance_summary_html(maintenance_df), unsafe_allow_html=True)
+
+def energy_summary_html(energy_df, costs=None, forecast=None, target_energy=None):
+    # target_energy overrides the fleet target, e.g. for a single site
+    targets = {} if target_energy is None else {"target_energy": target_energy}
+    summary = kpis.tariff_energy_kpis(energy_df, costs, **targets)
+    daily_savings = summary["daily_savings"]
+    rate_note = f"Based on ${summary['cost_per_kwh']}/kWh"
+    rows = [
+        cards.row("Target Daily Usage:", f"{summary['target_energy']:,.0f} kWh"),
+        cards.row("Avg. Daily Usage:", f"{summary['avg_energy']:,.0f} kWh"),
     ]
     
-    # Build the entire table HTML as a single concatenated string without line breaks
-    table_html = '<table class="alert-table"><thead><tr><th>Equipment</th><th>Issue</th><th>Status</th><th>Duration</th><th>Action Required</th></tr></thead><tbody>'
+    # Time-of-use costing from the tariff engine replaces the flat rate
+    if costs is not None:
+        rate_note = f"Based on ${summary['cost_per_kwh']:.3f}/kWh effective time-of-use rate"
+        rows.append(cards.row("Avg. Daily Cost:", f"${costs['avg_daily_cost']:,.0f}"))
     
-    for alert in alerts:
-        status_class = "status-high" if alert["status"] == "High" else "status-medium"
-        table_html += (
-            f'<tr>'
-            f'<td><strong>{alert["equipment"]}</strong></td>'
-            f'<td>{alert["issue"]}</td>'
-            f'<td class="{status_class}">{alert["status"]}</td>'
-            f'<td>{alert["duration"]}</td>'
-            f'<td>{alert["action"]}</td>'
-            f'</tr>'
-        )
+    if forecast is not None:
+        fleet = forecast["categories"]["forecast"]["Fleet"]
+        rows.append(cards.row(f"Forecast Daily Usage (next {len(fleet)} days):", f"{fleet.mean():,.0f} kWh"))
     
-    table_html += '</tbody></table>'
-    st.markdown(table_html, unsafe_allow_html=True)
+    rows.append(ENERGY_SAVINGS.format_map({"savings": f"${daily_savings:,.2f}", "rate_note": rate_note}))
+    return cards.panel("".join(rows), style="margin-top: 20px;")
 
-def display_performance_summary():
-    col1, col2, col3 = st.columns(3)
+def display_energy_summary(energy_df, costs=None, forecast=None):
+    st.markdown(energy_summary_html(energy_df, costs, forecast), unsafe_allow_html=True)
     
-    with col1:
-        st.markdown("""
-        <div class="summary-card">
-            <div style="text-align: center; font-weight: bold; margin-bottom: 15px;">
-                ✅ Positive Trends
-            </div>
-            <ul>
-                <li>Generator uptime at 100% for 6 days</li>
-                <li>Emergency repairs reduced by 33% this week</li>
-                <li>Energy consumption 7% below target yesterday</li>
-                <li>Preventive maintenance compliance at 98%</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+    if costs is not None:
+        with st.expander("Cost by category (last 7 days)"):
+            st.dataframe(
+                costs["by_category"].rename(columns={
+                    "category": "Category", "kwh": "kWh", "total_cost": "Cost ($)", "savings": "Savings ($)"
+                }).round(0),
+                hide_index=True,
+                use_container_width=True
+            )
     
-    with col2:
-        st.markdown("""
-        <div class="summary-card">
-            <div style="text-align: center; font-weight: bold; margin-bottom: 15px; color: #f59e0b;">
-                ⚠ Watch Areas
-            </div>
-            <ul>
-                <li>Compressor #7 running hot (needs inspection)</li>
-                <li>Chiller #3 refrigerant pressure low</li>
-                <li>Production Line B vibration increasing</li>
-                <li>Pending work orders increased by 20%</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+    if forecast is not None:
+        with st.expander(f"Forecast by category (next {len(forecast['categories']['forecast'])} days)"):
+            st.dataframe(
+                forecasting.category_summary(forecast).rename(columns={
+                    "category": "Category", "forecast_kwh": "Forecast kWh",
+                    "avg_daily_kwh": "Avg. Daily kWh", "peak_day_upper_kwh": "Peak Day (upper 80%)"
+                }).round(0),
+                hide_index=True,
+                use_container_width=True
+            )
+
+def display_alerts_table(alerts=None):
+    # Fall back to the sample alerts when no rule results are passed in
+    if alerts is None:
+        alerts = SAMPLE_ALERTS
     
-    with col3:
-        st.markdown("""
-        <div class="summary-card">
-            <div style="text-align: center; font-weight: bold; margin-bottom: 15px;">
-                📅 Upcoming Priorities
-            </div>
-            <ul>
-                <li>Monthly maintenance on Generator #1 (Tomorrow)</li>
-                <li>Quarterly inspection of all chillers (Next Week)</li>
-                <li>Compressor efficiency audit (Friday)</li>
-                <li>Energy optimization review meeting (Tomorrow 10AM)</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+    rows = "".join(
+        ALERT_ROW.format_map({
+            "equipment": html.escape(str(alert["equipment"])),
+            "issue": html.escape(str(alert["issue"])),
+            "status_class": "status-high" if alert["status"] == "High" else "status-medium",
+            "status": html.escape(str(alert["status"])),
+            # Repeat firings are merged into one row by the alert store
+            "flapping": " (flapping)" if alert.get("state") == "flapping" else "",
+            "duration": html.escape(str(alert["duration"])),
+            "firings": FIRINGS.format(alert["count"]) if alert.get("count", 1) > 1 else "",
+            "action": html.escape(str(alert["action"])),
+        })
+        for alert in alerts
+    )
+    st.markdown(ALERT_TABLE.format(rows=rows), unsafe_allow_html=True)
+
+SAMPLE_POSITIVE_TRENDS = [
+    "Generator uptime at 100% for 6 days",
+    "Emergency repairs reduced by 33% this week",
+    "Energy consumption 7% below target yesterday",
+    "Preventive maintenance compliance at 98%",
+]
+
+SAMPLE_WATCH_AREAS = [
+    "Compressor #7 running hot (needs inspection)",
+    "Chiller #3 refrigerant pressure low",
+    "Production Line B vibration increasing",
+    "Pending work orders increased by 20%",
+]
+
+UPCOMING_PRIORITIES = [
+    "Monthly maintenance on Generator #1 (Tomorrow)",
+    "Quarterly inspection of all chillers (Next Week)",
+    "Compressor efficiency audit (Friday)",
+    "Energy optimization review meeting (Tomorrow 10AM)",
+]
+
+def display_performance_summary(positive_trends=None, watch_areas=None):
+    cards.render_grid([
+        cards.list_card(
+            "✅ Positive Trends",
+            SAMPLE_POSITIVE_TRENDS if positive_trends is None else positive_trends,
+            empty_text="No notable improvements"
+        ),
+        cards.list_card(
+            "⚠ Watch Areas",
+            SAMPLE_WATCH_AREAS if watch_areas is None else watch_areas,
+            title_style="color: #f59e0b;",
+            empty_text="No anomalies detected"
+        ),
+        cards.list_card("📅 Upcoming Priorities", UPCOMING_PRIORITIES),
+    ], columns=3)
+
+def reliability_summary_html(reliability):
+    mttr = reliability["mttr_hours"]
+    mtbf = reliability["mtbf_hours"]
+    # Either is NaN when the selection has no completed corrective orders
+    mttr_class = "" if math.isnan(mttr) else "normal" if mttr <= 24 else "warning" if mttr <= 48 else "critical"
+    mtbf_class = "" if math.isnan(mtbf) else "normal" if mtbf >= 168 else "warning" if mtbf >= 72 else "critical"
+    body = "".join([
+        cards.metrics([
+            ("n/a" if math.isnan(mttr) else f"{mttr:,.1f} h", "Mean Time to Repair", mttr_class),
+            ("n/a" if math.isnan(mtbf) else f"{mtbf:,.0f} h", "Mean Time Between Failures", mtbf_class),
+        ]),
+        cards.row("Open work orders:", f"{reliability['open_orders']:,}"),
+        cards.row("Oldest open order:", f"{reliability['oldest_open_days']:,.1f} days"),
+    ])
+    return cards.panel(body, heading=f"Reliability ({reliability['assets']:,} assets)")
+
+def display_reliability_summary(reliability):
+    st.markdown(reliability_summary_html(reliability), unsafe_allow_html=True)
+
+def display_distribution_summary(percentiles):
+    rows = [
+        ("Fleet daily energy", percentiles["fleet_daily_kwh"], "{:,.0f} kWh"),
+        ("Daily energy per meter", percentiles["meter_daily_kwh"], "{:,.0f} kWh"),
+        ("Daily equipment uptime", percentiles["uptime_pct"], "{:.1f}%"),
+    ]
+    body = cards.table(
+        ["", "p50", "p95", "p99"],
+        [[label] + [fmt.format(values[q]) for q in (0.5, 0.95, 0.99)] for label, values, fmt in rows],
+    )
+    st.markdown(cards.panel(body, heading="Fleet Distribution"), unsafe_allow_html=True)
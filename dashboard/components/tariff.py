@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+from utils import engine
+from utils.cache import cached
+
+# Daily kWh targets per category; they add up to the fleet's 9,500 kWh target
+DAILY_TARGETS = {"Chillers": 4300, "Compressors": 3900, "Lighting": 1300}
+
+SEASONS = ("winter", "summer")
+DAY_TYPES = ("weekday", "weekend")
+
+class Tariff:
+    # Time-of-use energy rates by season, day type and hour, plus a monthly
+    # demand charge on each meter's peak kW
+    def __init__(self, schedule, summer_months=(6, 7, 8, 9), demand_rate=0.0):
+        schedule = pd.DataFrame(schedule, columns=["season", "day_type", "start_hour", "rate"])
+        season = schedule["season"].map(SEASONS.index)
+        day_type = schedule["day_type"].map(DAY_TYPES.index)
+        keys = (season * 2 + day_type) * 24 + schedule["start_hour"]
+        order = np.argsort(keys.to_numpy(), kind="stable")
+        self._keys = keys.to_numpy()[order]
+        self._rates = schedule["rate"].to_numpy(dtype="float64")[order]
+        for period in range(len(SEASONS) * len(DAY_TYPES)):
+            if period * 24 not in self._keys:
+                raise ValueError(
+                    f"tariff has no rate starting at hour 0 for "
+                    f"{SEASONS[period // 2]} {DAY_TYPES[period % 2]}"
+                )
+        self.summer_months = tuple(summer_months)
+        self.demand_rate = float(demand_rate)
+
+    def _identity(self):
+        return (tuple(self._keys), tuple(self._rates), self.summer_months, self.demand_rate)
+
+    def __eq__(self, other):
+        return isinstance(other, Tariff) and self._identity() == other._identity()
+
+    def __hash__(self):
+        return hash(self._identity())
+
+    def energy_rates(self, index):
+        # Sorted-interval lookup: each timestamp's (season, day type, hour) key
+        # lands on the last schedule row starting at or before it
+        summer = np.isin(index.month, self.summer_months)
+        weekend = index.dayofweek >= 5
+        keys = (summer.astype("int64") * 2 + weekend) * 24 + index.hour
+        return self._rates[np.searchsorted(self._keys, keys, side="right") - 1]
+
+DEFAULT_TARIFF = Tariff(
+    [
+        ("summer", "weekday", 0, 0.08), ("summer", "weekday", 8, 0.14),
+        ("summer", "weekday", 12, 0.22), ("summer", "weekday", 18, 0.14),
+        ("summer", "weekday", 22, 0.08),
+        ("summer", "weekend", 0, 0.08), ("summer", "weekend", 10, 0.11),
+        ("summer", "weekend", 20, 0.08),
+        ("winter", "weekday", 0, 0.07), ("winter", "weekday", 8, 0.12),
+        ("winter", "weekday", 17, 0.16), ("winter", "weekday", 21, 0.07),
+        ("winter", "weekend", 0, 0.07), ("winter", "weekend", 10, 0.09),
+        ("winter", "weekend", 20, 0.07),
+    ],
+    demand_rate=12.5,
+)
+
+def _interval_hours(index):
+    return (index[1:] - index[:-1]).median().total_seconds() / 3600 if len(index) > 1 else 0.25
+
+@cached("tariff")
+def interval_costs(readings, tariff=DEFAULT_TARIFF):
+    # Energy and demand cost for every (interval, meter) cell of the wide
+    # readings frame
+    kwh = readings.to_numpy(dtype="float64")
+    energy = kwh * tariff.energy_rates(readings.index)[:, None]
+
+    # Demand charge per meter-month on peak kW, spread over that month's
+    # intervals by kWh so it adds up correctly at any rollup level. Missing
+    # intervals are skipped rather than voiding the meter-month
+    month = readings.index.year * 12 + readings.index.month
+    starts = np.flatnonzero(np.r_[True, month[1:] != month[:-1]])
+    month_code = np.cumsum(np.r_[False, month[1:] != month[:-1]])
+    peak_kw = np.fmax.reduceat(kwh, starts, axis=0) / _interval_hours(readings.index)
+    month_kwh = np.add.reduceat(np.nan_to_num(kwh), starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        per_kwh = np.where(month_kwh > 0, peak_kw * tariff.demand_rate / month_kwh, 0.0)
+    demand = kwh * per_kwh[month_code]
+
+    return (
+        pd.DataFrame(energy, index=readings.index, columns=readings.columns),
+        pd.DataFrame(demand, index=readings.index, columns=readings.columns),
+    )
+
+@cached("tariff")
+def cost_rollup(readings, meters, freq="D", by="category", tariff=DEFAULT_TARIFF, targets=None):
+    targets = targets or DAILY_TARGETS
+    energy, demand = interval_costs(readings, tariff)
+    category = meters.set_index("meter_id")["category"].reindex(readings.columns)
+    groups = category.to_numpy() if by == "category" else readings.columns.to_numpy()
+
+    def rollup(frame):
+        # Rows by period, then columns by group
+        return engine.group_sums(engine.period_sums(frame, freq), groups).stack()
+
+    # Each meter's share of the target covers the days it reported
+    intervals_per_day = 24 / _interval_hours(readings.index)
+    days = readings.resample(freq).count() / intervals_per_day
+    meters_per_category = category.value_counts()
+    daily_target = category.map(lambda c: targets.get(c, 0) / meters_per_category[c])
+    target = engine.group_sums(days * daily_target.to_numpy(), groups).stack()
+
+    result = pd.DataFrame({
+        "kwh": rollup(readings.astype("float64")),
+        "energy_cost": rollup(energy),
+        "demand_cost": rollup(demand),
+        "target_kwh": target,
+    })
+    result.index.names = ["period", by]
+    result["total_cost"] = result["energy_cost"] + result["demand_cost"]
+    result["effective_rate"] = result["total_cost"] / result["kwh"].where(result["kwh"] > 0)
+    # Savings price the gap to target at the group's own effective rate
+    result["savings"] = (result["target_kwh"] - result["kwh"]) * result["effective_rate"]
+    return result.reset_index()
+
+@cached("tariff")
+def recent_cost_summary(readings, meters, days=7, tariff=DEFAULT_TARIFF, targets=None):
+    # Cost the full history, then keep the last days: demand charges are
+    # priced per month, so costing only the recent slice would put the
+    # whole month's peak charge on it
+    by_day = cost_rollup(readings, meters, freq="D", by="category", tariff=tariff, targets=targets)
+    by_category = by_day[by_day["period"] >= readings.index[-1].floor("D") - pd.Timedelta(days=days - 1)]
+    totals = by_category[["kwh", "total_cost", "savings"]].sum()
+    category_totals = by_category.groupby("category")[["kwh", "total_cost", "savings"]].sum()
+    return {
+        "avg_daily_cost": totals["total_cost"] / days,
+        "avg_daily_savings": totals["savings"] / days,
+        "effective_rate": totals["total_cost"] / totals["kwh"] if totals["kwh"] else 0.0,
+        "by_category": category_totals.reset_index(),
+    }
@@ -0,0 +1,77 @@
+import threading
+import time
+from components import data
+from utils import config
+from utils.ringbuffer import RingBuffer
+
+# Sensor channels behind the live status cards and alert rules
+CHANNELS = {
+    "compressor_7.temperature": {
+        "equipment": "Compressor #7", "label": "Compressor #7 Temp", "unit": "°C",
+        "target": "<82°C", "thresholds": {"normal": 82, "warning": 85}, "reverse": True,
+    },
+    "chiller_3.refrigerant_pressure": {
+        "equipment": "Chiller #3", "label": "Chiller #3 Refrigerant", "unit": "psi",
+        "target": ">60 psi", "thresholds": {"normal": 60, "warning": 58}, "reverse": False,
+    },
+    "generator_2.battery_voltage": {
+        "equipment": "Generator #2", "label": "Generator #2 Battery", "unit": "V",
+        "target": ">12.3 V", "thresholds": {"normal": 12.3, "warning": 12.1}, "reverse": False,
+    },
+    "production_line_b.vibration": {
+        "equipment": "Production Line B", "label": "Line B Vibration", "unit": "mm/s",
+        "target": "<3.5 mm/s", "thresholds": {"normal": 3.5, "warning": 4.5}, "reverse": True,
+    },
+}
+
+class TelemetryStore:
+    def __init__(self, hours=None, hz=None):
+        self.hours = config.TELEMETRY_HOURS if hours is None else hours
+        self.hz = config.TELEMETRY_HZ if hz is None else hz
+        self.capacity = int(self.hours * 3600 * self.hz)
+        self._buffers = {}
+        self._lock = threading.Lock()
+
+    def buffer(self, channel):
+        buffer = self._buffers.get(channel)
+        if buffer is None:
+            with self._lock:
+                buffer = self._buffers.setdefault(channel, RingBuffer(self.capacity))
+        return buffer
+
+    def channels(self):
+        return list(self._buffers)
+
+    def append(self, channel, timestamp, value):
+        self.buffer(channel).append(timestamp, value)
+
+    def extend(self, channel, timestamps, values):
+        self.buffer(channel).extend(timestamps, values)
+
+    def window(self, channel, seconds, now=None):
+        return self.buffer(channel).window(seconds, now)
+
+    def latest(self, channel):
+        return self.buffer(channel).latest()
+
+    @property
+    def nbytes(self):
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+_store = TelemetryStore()
+_ingest_lock = threading.Lock()
+
+def get_store():
+    return _store
+
+def ingest_synthetic(store=None, now=None):
+    # Stand-in for the sensor gateway: backfill every channel up to now
+    store = store or _store
+    now = time.time() if now is None else now
+    with _ingest_lock:
+        for channel in CHANNELS:
+            last = store.buffer(channel).last_timestamp
+            start = now - store.hours * 3600 if last is None else last + 1 / store.hz
+            timestamps, values = data.generate_sensor_readings(channel, start, now, store.hz)
+            store.extend(channel, timestamps, values)
+    return store
@@ -0,0 +1,166 @@
+import argparse
+import html
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+from plotly.offline import get_plotlyjs
+
+from components import charts, data, reliability, summary_cards, tariff
+from utils import config
+from utils.style import STYLESHEET
+
+logger = logging.getLogger("texo.report")
+
+PLOTLY_BUNDLE = "plotly.min.js"
+CHART_CONFIG = {"displaylogo": False, "responsive": True}
+
+PAGE = (
+    '<!DOCTYPE html><html><head><meta charset="utf-8"><title>{title}</title>'
+    '{scripts}{stylesheet}</head>'
+    '<body style="font-family: sans-serif; background: #f8fafc; max-width: 1200px; margin: 0 auto; padding: 20px;">'
+    '<h1 style="color: #1e3a8a;">{title}</h1><p style="color: #4b5563;">{subtitle}</p>{body}</body></html>'
+)
+SECTION = '<h2 class="section-title">{title}</h2><div style="display: grid; grid-template-columns: 2fr 1fr; gap: 20px;">{left}<div>{right}</div></div>'
+INDEX_ITEM = '<li><a href="sites/{file}">{site}</a></li>'
+
+# Set in each worker process by _init_worker
+_options = {}
+
+
+def slug(site):
+    return re.sub(r"[^a-z0-9]+", "-", site.lower()).strip("-")
+
+
+def site_list(meters):
+    # Sites in meter-table order, which is also the asset register's order
+    return list(pd.unique(meters["site"]))
+
+
+def site_energy(readings, meters, site, days=7):
+    # The dashboard's daily energy frame and category targets for one site;
+    # each meter carries an even share of its category's fleet target
+    site_meters = meters[meters["site"] == site]
+    daily = data.daily_totals(readings)[site_meters["meter_id"]].tail(days)
+    by_category = daily.T.groupby(site_meters["category"].to_numpy()).sum().T
+    energy_df = pd.DataFrame({"Date": daily.index.strftime("%Y-%m-%d")})
+    for category in data.ENERGY_CATEGORIES:
+        energy_df[f"{category} (kWh)"] = by_category[category].to_numpy() if category in by_category else 0.0
+    energy_df["Total (kWh)"] = by_category.sum(axis=1).to_numpy()
+
+    fleet_counts = meters["category"].value_counts()
+    site_counts = site_meters["category"].value_counts()
+    targets = {c: tariff.DAILY_TARGETS.get(c, 0) * n / fleet_counts[c] for c, n in site_counts.items()}
+    return energy_df, site_meters, targets
+
+
+def _chart(fig):
+    return fig.to_html(full_html=False, include_plotlyjs=False, config=CHART_CONFIG)
+
+
+def render_site(site):
+    started = time.perf_counter()
+    readings, meters = data.load_energy_intervals(_options["snapshot_dir"])
+    events = data.load_work_order_events()
+
+    energy_df, site_meters, targets = site_energy(readings, meters, site)
+    site_readings = readings[site_meters["meter_id"]]
+    costs = tariff.recent_cost_summary(site_readings, site_meters, targets=targets)
+    body = SECTION.format(
+        title="Energy",
+        left=_chart(charts.create_energy_consumption_chart(energy_df)),
+        right=summary_cards.energy_summary_html(energy_df, costs, target_energy=sum(targets.values())),
+    )
+
+    # The dashboard's index, so a site shows the same work orders in both
+    site_events = data.work_order_index(events).select(events, site=[site])
+    stats = reliability.compute_reliability(site_events)
+    if stats is not None:
+        body += SECTION.format(
+            title="Maintenance",
+            left=_chart(charts.create_backlog_age_chart(stats["backlog"])),
+            right=summary_cards.reliability_summary_html(stats),
+        )
+
+    page = PAGE.format(
+        title=html.escape(site), scripts=f'<script src="../{PLOTLY_BUNDLE}"></script>', stylesheet=STYLESHEET, body=body,
+        subtitle=html.escape(f"{len(site_meters)} meters · generated {_options['generated']} · data {data.data_version(readings)}"),
+    )
+    path = os.path.join(_options["out_dir"], "sites", f"{slug(site)}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(page)
+    return site, path, time.perf_counter() - started
+
+
+def _init_worker(out_dir, snapshot_dir, generated):
+    _options.update(out_dir=out_dir, snapshot_dir=snapshot_dir, generated=generated)
+
+
+def write_bundle(out_dir):
+    # One plotly.js for every report page, written only when it changes
+    path = os.path.join(out_dir, PLOTLY_BUNDLE)
+    bundle = get_plotlyjs().encode()
+    if not os.path.exists(path) or os.path.getsize(path) != len(bundle):
+        with open(path, "wb") as f:
+            f.write(bundle)
+    return path
+
+
+def generate(out_dir=None, workers=None, snapshot_dir=None, sites=None):
+    out_dir = out_dir or config.REPORT_DIR
+    workers = workers or config.REPORT_WORKERS
+    os.makedirs(os.path.join(out_dir, "sites"), exist_ok=True)
+    write_bundle(out_dir)
+    known = site_list(data.load_energy_intervals(snapshot_dir)[1])
+    if sites is None:
+        sites = known
+    unknown = [site for site in sites if site not in known]
+    if unknown:
+        raise ValueError(f"unknown site(s) {', '.join(map(repr, unknown))}; the meter table has {', '.join(known)}")
+
+    started = time.perf_counter()
+    options = (out_dir, snapshot_dir, f"{datetime.now():%Y-%m-%d %H:%M}")
+    if workers <= 1:
+        _init_worker(*options)
+        results = [render_site(site) for site in sites]
+    else:
+        # Workers map the same Arrow snapshot, so the data is not copied per
+        # process; each fills its own cache once and reuses it for its sites
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=options) as pool:
+            results = list(pool.map(render_site, sites, chunksize=max(1, len(sites) // (workers * 4))))
+    elapsed = time.perf_counter() - started
+
+    items = "".join(INDEX_ITEM.format(file=f"{slug(site)}.html", site=html.escape(site)) for site in sites)
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(PAGE.format(
+            title="Site reports", scripts="", stylesheet=STYLESHEET, body=f"<ul>{items}</ul>",
+            subtitle=f"{len(sites)} sites · generated {options[2]}",
+        ))
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a static HTML dashboard report for every site")
+    parser.add_argument("--out", default=config.REPORT_DIR, help="report directory")
+    parser.add_argument("--workers", type=int, default=config.REPORT_WORKERS, help="report processes")
+    parser.add_argument("--snapshot-dir", default=None, help="snapshot directory (default TEXO_SNAPSHOT_DIR)")
+    parser.add_argument("--site", action="append", help="only these sites (repeatable)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    try:
+        results, elapsed = generate(args.out, args.workers, args.snapshot_dir, args.site)
+    except ValueError as e:
+        parser.error(str(e))
+    logger.info(
+        "wrote %d site reports to %s in %.2fs with %d workers (%.1f sites/s)",
+        len(results), args.out, elapsed, args.workers, len(results) / elapsed if elapsed else 0,
+    )
+
+
+if __name__ == "__main__":
+    main()
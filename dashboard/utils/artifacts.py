@@ -0,0 +1,78 @@
+import logging
+import os
+import pickle
+import shutil
+import threading
+
+from utils import config
+
+logger = logging.getLogger("texo.artifacts")
+
+ARTIFACT_FILE = "cache.pkl"
+
+_lock = threading.Lock()
+_restored = set()
+
+
+def artifact_path(version, directory=None):
+    return os.path.join(directory or config.ARTIFACT_DIR, version, ARTIFACT_FILE)
+
+
+def _check_private(path):
+    # Unpickling runs code, so artifacts are only trusted from paths this
+    # user owns that no one else can write to
+    info = os.stat(path)
+    if info.st_uid != os.getuid() or info.st_mode & 0o022:
+        raise PermissionError(f"{path} must be owned by this user and not writable by others")
+
+
+def save_artifacts(version, entries, directory=None, keep=3):
+    directory = directory or config.ARTIFACT_DIR
+    path = artifact_path(version, directory)
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    _check_private(directory)
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.chmod(tmp, 0o600)
+    os.replace(tmp, path)
+
+    versions = sorted(name for name in os.listdir(directory) if os.path.isdir(os.path.join(directory, name)))
+    for name in versions[:-keep]:
+        if name != version:
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+    return path
+
+
+def load_artifacts(version, directory=None):
+    path = artifact_path(version, directory)
+    try:
+        for checked in (os.path.dirname(os.path.dirname(path)), os.path.dirname(path), path):
+            _check_private(checked)
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except PermissionError as e:
+        logger.warning("not loading artifacts for %s: %s", version, e)
+        return None
+    except Exception:
+        # A stale or partial artifact is never worth failing a page over
+        logger.warning("ignoring unreadable artifacts for %s", version, exc_info=True)
+        return None
+
+
+def restore_once(version, cache, directory=None):
+    if version in _restored:
+        return 0
+    with _lock:
+        if version in _restored:
+            return 0
+        _restored.add(version)
+        entries = load_artifacts(version, directory) or {}
+        for key, value in entries.items():
+            cache.put(key, value)
+    if entries:
+        logger.info("restored %d precomputed artifacts for %s", len(entries), version)
+    return len(entries)
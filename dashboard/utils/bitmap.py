@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+
+class BitmapIndex:
+    # One bit-packed row bitmap per value of each categorical dimension,
+    # built once per data version. A filter ORs the bitmaps of the chosen
+    # values within a dimension and ANDs across dimensions, 64 rows per
+    # word, and only the surviving rows are gathered from the table.
+    def __init__(self, dimensions):
+        self.n_rows = None
+        self._bitmaps = {}
+        for name, values in dimensions.items():
+            codes, uniques = pd.factorize(np.asarray(values), sort=True)
+            if self.n_rows is None:
+                self.n_rows = len(codes)
+            elif len(codes) != self.n_rows:
+                raise ValueError(f"dimension {name!r} has {len(codes)} rows, expected {self.n_rows}")
+            self._bitmaps[name] = {value: self._pack(codes == code) for code, value in enumerate(uniques)}
+        self.n_rows = self.n_rows or 0
+        self._words = -(-self.n_rows // 64)
+
+    @staticmethod
+    def _pack(bits):
+        packed = np.packbits(bits, bitorder="little")
+        return np.pad(packed, (0, -len(packed) % 8)).view("uint64")
+
+    def values(self, name):
+        return list(self._bitmaps[name])
+
+    def mask(self, **filters):
+        # None, or every value of a dimension, leaves that dimension open;
+        # the result is None when nothing narrows the rows
+        result = None
+        for name, selected in filters.items():
+            bitmaps = self._bitmaps[name]
+            if selected is None or set(bitmaps) <= set(selected):
+                continue
+            combined = np.zeros(self._words, dtype="uint64")
+            for value in selected:
+                if value in bitmaps:
+                    combined |= bitmaps[value]
+            result = combined if result is None else result & combined
+        return result
+
+    def _positions(self, mask):
+        if mask is None:
+            return np.arange(self.n_rows)
+        return np.flatnonzero(np.unpackbits(mask.view("uint8"), count=self.n_rows, bitorder="little"))
+
+    def rows(self, **filters):
+        return self._positions(self.mask(**filters))
+
+    def count(self, **filters):
+        mask = self.mask(**filters)
+        return self.n_rows if mask is None else int(np.bitwise_count(mask).sum())
+
+    def select(self, df, **filters):
+        # Gather only the matching rows of the frame the index was built on
+        mask = self.mask(**filters)
+        return df if mask is None else df.take(self._positions(mask))
+
+    @property
+    def nbytes(self):
+        return sum(bitmap.nbytes for bitmaps in self._bitmaps.values() for bitmap in bitmaps.values())
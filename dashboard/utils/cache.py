@@ -0,0 +1,166 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from utils import config
+
+_MISSING = object()
+
+
+def estimate_size(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(getattr(value, "nbytes", None), int):
+        # Stores and indexes that report their own footprint
+        return value.nbytes
+    if isinstance(value, go.Figure):
+        # Serialized length is what the figure costs us on the wire too
+        return len(value.to_json())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+class CacheEntry:
+    __slots__ = ("value", "size", "hits", "created", "last_access")
+
+    def __init__(self, value, size):
+        self.value = value
+        self.size = size
+        self.hits = 0
+        self.created = self.last_access = time.time()
+
+
+class ByteLRUCache:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.resident_bytes = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            entry.hits += 1
+            entry.last_access = time.time()
+            self.hits += 1
+            return entry.value
+
+    def put(self, key, value, size=None):
+        size = estimate_size(value) if size is None else size
+        if size > self.max_bytes:
+            # Caching it would flush everything else and still not fit
+            return False
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.resident_bytes -= old.size
+            self._entries[key] = CacheEntry(value, size)
+            self.resident_bytes += size
+            while self.resident_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.resident_bytes -= evicted.size
+                self.evictions += 1
+        return True
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            # Computed outside the lock so a slow build never blocks other sessions
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def items(self):
+        with self._lock:
+            return [(key, e.value) for key, e in self._entries.items()]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.resident_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "resident_bytes": self.resident_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def entries(self):
+        with self._lock:
+            return [
+                {"key": repr(key), "bytes": e.size, "hits": e.hits,
+                 "age_s": round(time.time() - e.created, 1),
+                 "idle_s": round(time.time() - e.last_access, 1)}
+                # Most recently used first
+                for key, e in reversed(self._entries.items())
+            ]
+
+
+def _key_part(arg):
+    if isinstance(arg, (pd.DataFrame, pd.Series)):
+        version = arg.attrs.get("data_version")
+        if version is not None:
+            # Values are immutable within a version, so hashing the index is
+            # enough to tell filtered slices of the same snapshot apart
+            columns = tuple(arg.columns) if isinstance(arg, pd.DataFrame) else arg.name
+            if isinstance(arg.index, pd.RangeIndex):
+                index_key = (arg.index.start, arg.index.stop, arg.index.step)
+            else:
+                index_key = int(pd.util.hash_pandas_object(arg.index).sum())
+            return ("frame", version, columns, index_key)
+        return ("frame", int(pd.util.hash_pandas_object(arg, index=True).sum()))
+    if isinstance(arg, (list, tuple)):
+        return tuple(_key_part(a) for a in arg)
+    if isinstance(arg, dict):
+        return tuple(sorted((k, _key_part(v)) for k, v in arg.items()))
+    try:
+        hash(arg)
+    except TypeError:
+        return repr(arg)
+    return arg
+
+
+def make_key(namespace, args, kwargs):
+    return (namespace, _key_part(args), _key_part(kwargs))
+
+
+def cached(namespace):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(namespace + "." + func.__name__, args, kwargs)
+            return CACHE.get_or_compute(key, lambda: func(*args, **kwargs))
+        wrapper.uncached = func
+        return wrapper
+    return decorator
+
+
+# One cache per server process, shared by every session
+CACHE = ByteLRUCache(config.CACHE_MAX_BYTES)
@@ -0,0 +1,56 @@
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.exceptions import RerunException, StopException
+from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequestType
+
+from utils import config, metrics
+
+_DEADLINE_KEY = "_debounce_until"
+
+
+def checkpoint():
+    # Explicit yield point for before expensive work. Streamlit only
+    # preempts a run when it next sends an element, so a superseded run
+    # would otherwise finish any aggregation it had started.
+    ctx = get_script_run_ctx(suppress_warning=True)
+    requests = getattr(ctx, "script_requests", None)
+    if requests is None:
+        return
+    request = requests.on_scriptrunner_yield()
+    if request is None:
+        return
+    if request.type == ScriptRequestType.RERUN:
+        raise RerunException(request.rerun_data)
+    raise StopException()
+
+
+def debounce():
+    # on_change callback for slider-style inputs: the run this change
+    # triggers waits out the debounce window before doing any work
+    st.session_state[_DEADLINE_KEY] = time.monotonic() + config.DEBOUNCE_SECONDS
+
+
+def settle():
+    deadline = st.session_state.get(_DEADLINE_KEY)
+    if deadline is None:
+        return
+    try:
+        while (remaining := deadline - time.monotonic()) > 0:
+            time.sleep(min(remaining, 0.02))
+            checkpoint()
+    except (RerunException, StopException):
+        # Another change arrived inside the window; this run did no work
+        metrics.incr("reruns_skipped")
+        raise
+    del st.session_state[_DEADLINE_KEY]
+
+
+def run_page(page):
+    settle()
+    try:
+        page.run()
+    except (RerunException, StopException):
+        metrics.incr("reruns_cancelled")
+        raise
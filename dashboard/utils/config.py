@@ -0,0 +1,48 @@
+import os
+import tempfile
+
+# Shared memory is preferred for snapshots so mapped pages never touch disk
+_default_snapshot_root = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+SNAPSHOT_DIR = os.environ.get("TEXO_SNAPSHOT_DIR", os.path.join(_default_snapshot_root, "texo-snapshots"))
+REFRESH_INTERVAL_SECONDS = int(os.environ.get("TEXO_REFRESH_SECONDS", 15 * 60))
+SNAPSHOTS_TO_KEEP = int(os.environ.get("TEXO_SNAPSHOTS_TO_KEEP", 3))
+
+CACHE_MAX_BYTES = int(float(os.environ.get("TEXO_CACHE_MAX_MB", 256)) * 1024 * 1024)
+DEBUG = os.environ.get("TEXO_DEBUG", "").lower() in ("1", "true", "yes")
+
+# Artifacts are pickles, so they live in a per-user directory rather than a
+# shared temp path (see utils/artifacts.py)
+_user_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+ARTIFACT_DIR = os.environ.get("TEXO_ARTIFACT_DIR", os.path.join(_user_cache, "texo", "artifacts"))
+
+LIVE_REFRESH_SECONDS = int(os.environ.get("TEXO_LIVE_REFRESH_SECONDS", 60))
+LIVE_WINDOW_POINTS = int(os.environ.get("TEXO_LIVE_WINDOW_POINTS", 0)) or None
+
+TELEMETRY_HOURS = float(os.environ.get("TEXO_TELEMETRY_HOURS", 6))
+TELEMETRY_HZ = float(os.environ.get("TEXO_TELEMETRY_HZ", 1))
+
+WORK_ORDER_LOG = os.environ.get("TEXO_WORK_ORDER_LOG")
+WORK_ORDER_CHUNK_ROWS = int(os.environ.get("TEXO_WORK_ORDER_CHUNK_ROWS", 250_000))
+STATE_LOG = os.environ.get("TEXO_STATE_LOG")
+
+EXPORT_CHUNK_ROWS = int(os.environ.get("TEXO_EXPORT_CHUNK_ROWS", 100_000))
+
+ENGINE = os.environ.get("TEXO_ENGINE", "pandas").lower()
+
+ALERT_CLEAR_SECONDS = int(os.environ.get("TEXO_ALERT_CLEAR_SECONDS", 300))
+ALERT_FLAP_WINDOW_SECONDS = int(os.environ.get("TEXO_ALERT_FLAP_WINDOW_SECONDS", 3600))
+ALERT_FLAP_LIMIT = int(os.environ.get("TEXO_ALERT_FLAP_LIMIT", 3))
+ALERT_EXPIRE_SECONDS = int(os.environ.get("TEXO_ALERT_EXPIRE_SECONDS", 24 * 3600))
+
+DEBOUNCE_SECONDS = float(os.environ.get("TEXO_DEBOUNCE_MS", 300)) / 1000
+
+FORECAST_DAYS = int(os.environ.get("TEXO_FORECAST_DAYS", 7))
+FORECAST_WORKERS = int(os.environ.get("TEXO_FORECAST_WORKERS", 0)) or os.cpu_count() or 1
+FORECAST_PROCESS_MIN_SERIES = int(os.environ.get("TEXO_FORECAST_PROCESS_MIN_SERIES", 2000))
+
+API_HOST = os.environ.get("TEXO_API_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("TEXO_API_PORT", 8600))
+
+REPORT_DIR = os.environ.get("TEXO_REPORT_DIR", os.path.join(tempfile.gettempdir(), "texo-reports"))
+REPORT_WORKERS = int(os.environ.get("TEXO_REPORT_WORKERS", 0)) or os.cpu_count() or 1
@@ -0,0 +1,96 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from utils import config
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+logger = logging.getLogger("texo.engine")
+
+# Aggregations behind the charts and KPIs run on pandas by default or on
+# polars (multi-threaded, Arrow-native) with TEXO_ENGINE=polars. Inputs and
+# results are pandas either way; only the work in between changes.
+ENGINES = ("pandas", "polars")
+ENGINE = config.ENGINE if config.ENGINE in ENGINES else "pandas"
+if ENGINE == "polars" and pl is None:
+    logger.warning("TEXO_ENGINE=polars but polars is not installed; using pandas")
+    ENGINE = "pandas"
+
+
+def _resolve(engine):
+    engine = engine or ENGINE
+    if engine == "polars" and pl is None:
+        return "pandas"
+    return engine
+
+
+def _fixed_every(freq):
+    # Polars truncates on fixed-width windows; calendar frequencies (weeks
+    # anchored on a weekday, months) stay on pandas
+    try:
+        return f"{pd.tseries.frequencies.to_offset(freq).nanos}ns"
+    except ValueError:
+        return None
+
+
+def _to_polars(frame, index_name=None):
+    # A single-dtype wide frame goes over as one 2-D block rather than
+    # column by column. NaN becomes null so polars skips gaps in sums the
+    # way pandas does
+    columns = [str(c) for c in frame.columns]
+    table = pl.from_numpy(frame.to_numpy(), schema=columns, orient="row").fill_nan(None)
+    if index_name is not None:
+        table = table.with_columns(pl.Series(index_name, frame.index.as_unit("ns").to_numpy()))
+    return table, columns
+
+
+def period_sums(frame, freq="D", engine=None):
+    # Per-column sums over each period of a sorted DatetimeIndex-ed frame,
+    # like frame.resample(freq).sum()
+    engine = _resolve(engine)
+    every = _fixed_every(freq) if engine == "polars" else None
+    if every is None or frame.empty:
+        return frame.resample(freq).sum()
+
+    name = "__period__"
+    table, columns = _to_polars(frame, name)
+    # The frame is sorted, so first-seen group order is already time order
+    summed = table.group_by(pl.col(name).dt.truncate(every), maintain_order=True).agg(pl.col(columns).sum())
+    result = pd.DataFrame(
+        summed.select(columns).to_numpy(), index=pd.DatetimeIndex(summed[name].to_numpy(), name=frame.index.name),
+        columns=frame.columns,
+    )
+    # resample() keeps empty periods as zero rows
+    full = pd.date_range(result.index[0], result.index[-1], freq=freq, name=frame.index.name).as_unit(frame.index.unit)
+    return result.reindex(full, fill_value=0)
+
+
+def group_sums(frame, groups, engine=None):
+    # Sum columns that share a group label, like frame.T.groupby(groups).sum().T
+    engine = _resolve(engine)
+    if engine == "pandas":
+        return frame.T.groupby(np.asarray(groups)).sum().T
+
+    labels, uniques = pd.factorize(np.asarray(groups), sort=True)
+    table, columns = _to_polars(frame)
+    summed = table.select(
+        pl.sum_horizontal([pl.col(columns[i]) for i in np.flatnonzero(labels == code)]).alias(str(code))
+        for code in range(len(uniques))
+    )
+    return pd.DataFrame(summed.to_numpy(), index=frame.index, columns=pd.Index(uniques))
+
+
+def column_aggregates(df, aggregations, engine=None):
+    # {column: "sum" | "mean"} -> {column: value}
+    engine = _resolve(engine)
+    if engine == "pandas":
+        return {column: getattr(df[column], how)() for column, how in aggregations.items()}
+
+    table = pl.from_pandas(df[list(aggregations)])
+    row = table.select(getattr(pl.col(column), how)() for column, how in aggregations.items()).row(0)
+    return dict(zip(aggregations, row))
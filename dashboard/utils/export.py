@@ -0,0 +1,40 @@
+import io
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from utils import config
+
+
+def write_csv(df, out, chunk_rows=None, index=False):
+    # Streamed one slice at a time through Arrow's CSV writer, so the export
+    # is never held as one Python string and rows are never formatted in Python
+    chunk_rows = chunk_rows or config.EXPORT_CHUNK_ROWS
+    schema = pa.Schema.from_pandas(df, preserve_index=index)
+    with pa_csv.CSVWriter(out, schema) as writer:
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start:start + chunk_rows]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=index))
+    return out
+
+
+def write_parquet(df, out, index=False):
+    # One columnar write; pyarrow converts column buffers without going
+    # through rows
+    table = pa.Table.from_pandas(df, preserve_index=index)
+    pq.write_table(table, out, compression="zstd")
+    return out
+
+
+WRITERS = {
+    "csv": (write_csv, "text/csv"),
+    "parquet": (write_parquet, "application/vnd.apache.parquet"),
+}
+
+
+def export_file(df, fmt, index=False):
+    writer, _ = WRITERS[fmt]
+    out = writer(df, io.BytesIO(), index=index)
+    out.seek(0)
+    return out
@@ -0,0 +1,32 @@
+import numpy as np
+
+
+def split_intervals(starts, ends, edges):
+    # Cut half-open intervals [start, end) at the window edges. Returns, for
+    # every piece, the interval it came from, the window it falls in and its
+    # length; an interval spanning k windows becomes k pieces via np.repeat,
+    # and the parts outside edges[0]..edges[-1] are dropped.
+    starts, ends, edges = (np.asarray(a, dtype="int64") for a in (starts, ends, edges))
+    n_windows = len(edges) - 1
+    keep = np.flatnonzero((ends > starts) & (ends > edges[0]) & (starts < edges[-1]))
+    first = np.searchsorted(edges, starts[keep], side="right") - 1
+    last = np.searchsorted(edges, ends[keep], side="left") - 1
+    first = np.clip(first, 0, n_windows - 1)
+    last = np.clip(last, 0, n_windows - 1)
+
+    spans = last - first + 1
+    interval = np.repeat(keep, spans)
+    offsets = np.repeat(np.cumsum(spans) - spans, spans)
+    window = np.repeat(first, spans) + np.arange(spans.sum()) - offsets
+    length = np.minimum(ends[interval], edges[window + 1]) - np.maximum(starts[interval], edges[window])
+    return interval, window, length
+
+
+def next_in_group(groups, times, end):
+    # For rows sorted by (group, time): each row's end is the next row's time
+    # in the same group, or `end` for the last row of a group
+    groups, times = np.asarray(groups), np.asarray(times, dtype="int64")
+    ends = np.full(len(times), end, dtype="int64")
+    same = groups[1:] == groups[:-1]
+    ends[:-1] = np.where(same, times[1:], end)
+    return ends, np.append(~same, True)
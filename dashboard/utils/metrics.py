@@ -0,0 +1,38 @@
+import threading
+import time
+from collections import defaultdict, deque
+
+_lock = threading.Lock()
+_counters = defaultdict(int)
+_timings = defaultdict(lambda: deque(maxlen=500))
+_values = {}
+
+PROCESS_STARTED = time.time()
+
+
+def incr(name, amount=1):
+    with _lock:
+        _counters[name] += amount
+
+
+def observe(name, seconds):
+    with _lock:
+        _timings[name].append(seconds)
+
+
+def set_once(name, value):
+    with _lock:
+        if name in _values:
+            return False
+        _values[name] = value
+        return True
+
+
+def snapshot():
+    with _lock:
+        timings = {
+            name: {"count": len(values), "last": values[-1], "max": max(values),
+                   "mean": sum(values) / len(values)}
+            for name, values in _timings.items() if values
+        }
+        return {"counters": dict(_counters), "timings": timings, "values": dict(_values)}
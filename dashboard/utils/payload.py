@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+MS_PER_NS = 1_000_000
+
+
+def typed_array(values, precision="float32"):
+    # plotly serializes NumPy arrays as base64 typed arrays ({"dtype", "bdata"})
+    # and already narrows integers; floats are narrowed here since chart
+    # values never need more than single precision
+    array = np.asarray(values)
+    if array.dtype.kind == "f":
+        return array.astype(precision, copy=False)
+    if array.dtype.kind in "iub":
+        return array
+    return pd.to_numeric(array).astype(precision)
+
+
+def date_axis(dates):
+    # Trace kwargs for a date x axis: a uniform series collapses to x0/dx,
+    # anything else becomes a float64 typed array of epoch milliseconds
+    stamps = pd.to_datetime(pd.Index(dates))
+    ms = stamps.as_unit("ns").asi8 // MS_PER_NS
+    if len(ms) > 1:
+        steps = np.diff(ms)
+        if (steps == steps[0]).all():
+            return {"x0": stamps[0].isoformat(), "dx": int(steps[0])}
+    elif len(ms) == 1:
+        return {"x0": stamps[0].isoformat(), "dx": 0}
+    return {"x": ms.astype("float64")}
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+# How readings in a grid bucket become one value:
+#   "sum"        readings are increments (kWh, counts) and add up; a bucket
+#                with no readings is unknown (NaN), not zero
+#   "time_mean"  readings are levels (uptime %, backlog) held until the next
+#                reading or for at most `hold`; the bucket value is their
+#                time-weighted mean over the covered part of the bucket
+AGGREGATIONS = ("sum", "time_mean")
+
+
+def grid_edges(start, end, freq):
+    # Bucket boundaries covering start..end inclusive, as int64 nanoseconds
+    edges = pd.date_range(pd.Timestamp(start).floor(freq), pd.Timestamp(end).floor(freq), freq=freq)
+    edges = edges.append(pd.DatetimeIndex([edges[-1] + pd.tseries.frequencies.to_offset(freq)]))
+    return edges.as_unit("ns")
+
+
+def bucket_sums(times, values, edges):
+    # Per-bucket sums and reading counts for every column at once: each
+    # (bucket, column) pair becomes one bincount slot
+    n_buckets, n_columns = len(edges) - 1, values.shape[1]
+    bucket = np.searchsorted(edges, times, side="right") - 1
+    inside = (bucket >= 0) & (bucket < n_buckets)
+    bucket, values = bucket[inside], values[inside]
+    valid = ~np.isnan(values)
+    slots = (bucket[:, None] * n_columns + np.arange(n_columns)).ravel()
+    size = n_buckets * n_columns
+    sums = np.bincount(slots, weights=np.where(valid, values, 0).ravel(), minlength=size)
+    counts = np.bincount(slots, weights=valid.ravel(), minlength=size)
+    return sums.reshape(n_buckets, n_columns), counts.reshape(n_buckets, n_columns).astype("int64")
+
+
+def time_weighted_means(times, values, edges, hold):
+    # Integrate the held step function and the covered time, both piecewise
+    # linear between reading starts and hold ends, then difference the two
+    # integrals at the bucket edges
+    origin = edges[0]
+    starts = (times - origin).astype("float64")
+    ends = np.minimum(starts + hold, np.append(starts[1:], np.inf))
+    valid = ~np.isnan(values)
+    widths = (ends - starts)[:, None] * valid
+    area = np.where(valid, values, 0) * widths
+    cum_area = np.vstack([np.zeros(values.shape[1]), np.cumsum(area, axis=0)])
+    cum_cover = np.vstack([np.zeros(values.shape[1]), np.cumsum(widths, axis=0)])
+
+    # Integral at time x: everything before the reading in force, plus the
+    # covered part of that reading
+    x = (edges - origin).astype("float64")
+    k = np.searchsorted(starts, x, side="right") - 1
+    before = np.maximum(k, 0)
+    into = np.where(k >= 0, np.minimum(x - starts[before], ends[before] - starts[before]), 0)[:, None]
+    current = (k >= 0)[:, None] * valid[before]
+    covered = cum_cover[before] + into * current
+    integral = cum_area[before] + into * current * np.where(valid[before], values[before], 0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.diff(integral, axis=0) / np.diff(covered, axis=0)
+    _, counts = bucket_sums(times, values, edges)
+    return means, counts
+
+
+def to_grid(frame, freq, policies, start=None, end=None):
+    # Align a DatetimeIndex-ed frame of irregular readings onto a uniform
+    # grid. policies maps columns to {"agg": ..., "hold": ...}; a "default"
+    # entry covers the rest. Returns the gridded values and a same-shaped
+    # frame that is True wherever a bucket had no readings.
+    frame = frame if frame.index.is_monotonic_increasing else frame.sort_index()
+    edges = grid_edges(frame.index.min() if start is None else start,
+                       frame.index.max() if end is None else end, freq)
+    times = frame.index.as_unit("ns").asi8
+    index = pd.DatetimeIndex(edges[:-1], name=frame.index.name)
+    values = pd.DataFrame(np.nan, index=index, columns=frame.columns)
+    gaps = pd.DataFrame(False, index=index, columns=frame.columns)
+
+    groups = {}
+    for column in frame.columns:
+        policy = policies.get(column, policies.get("default"))
+        if policy is None or policy["agg"] not in AGGREGATIONS:
+            raise ValueError(f"no resampling policy for {column!r}")
+        groups.setdefault((policy["agg"], policy.get("hold", freq)), []).append(column)
+
+    for (agg, hold), columns in groups.items():
+        block = frame[columns].to_numpy(dtype="float64")
+        if agg == "sum":
+            result, counts = bucket_sums(times, block, edges.asi8)
+            result = np.where(counts > 0, result, np.nan)
+        else:
+            result, counts = time_weighted_means(times, block, edges.asi8, pd.Timedelta(hold).value)
+        values[columns] = result
+        gaps[columns] = counts == 0
+    return values, gaps
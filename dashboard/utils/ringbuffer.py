@@ -0,0 +1,73 @@
+import threading
+
+import numpy as np
+
+
+class RingBuffer:
+    # Fixed-capacity (timestamp, value) buffer. Every sample is written twice,
+    # at i and i + capacity, so the most recent n samples are always one
+    # contiguous slice and windows come back as views rather than copies.
+    def __init__(self, capacity, dtype="float32"):
+        self.capacity = int(capacity)
+        self._times = np.zeros(2 * self.capacity, dtype="float64")
+        self._values = np.zeros(2 * self.capacity, dtype=dtype)
+        self._head = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def nbytes(self):
+        return self._times.nbytes + self._values.nbytes
+
+    def append(self, timestamp, value):
+        with self._lock:
+            i = self._head
+            self._times[i] = self._times[i + self.capacity] = timestamp
+            self._values[i] = self._values[i + self.capacity] = value
+            self._head = (i + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+    def extend(self, timestamps, values):
+        timestamps = np.asarray(timestamps, dtype="float64")[-self.capacity:]
+        values = np.asarray(values)[-self.capacity:]
+        n = len(timestamps)
+        if n == 0:
+            return
+        with self._lock:
+            idx = (self._head + np.arange(n)) % self.capacity
+            self._times[idx] = self._times[idx + self.capacity] = timestamps
+            self._values[idx] = self._values[idx + self.capacity] = values
+            self._head = (self._head + n) % self.capacity
+            self._count = min(self._count + n, self.capacity)
+
+    def last(self, n=None):
+        with self._lock:
+            n = self._count if n is None else min(int(n), self._count)
+            end = self._head + self.capacity
+            times = self._times[end - n:end]
+            values = self._values[end - n:end]
+        # Read-only so callers can't scribble on the live buffer
+        times.flags.writeable = False
+        values.flags.writeable = False
+        return times, values
+
+    def window(self, seconds, now=None):
+        times, values = self.last()
+        if not len(times):
+            return times, values
+        now = times[-1] if now is None else now
+        start = np.searchsorted(times, now - seconds, side="left")
+        return times[start:], values[start:]
+
+    def latest(self):
+        times, values = self.last(1)
+        if not len(times):
+            return None, None
+        return float(times[0]), float(values[0])
+
+    @property
+    def last_timestamp(self):
+        return self.latest()[0]
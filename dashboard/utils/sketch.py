@@ -0,0 +1,92 @@
+import math
+
+import numpy as np
+
+
+class QuantileSketch:
+    # Log-bucketed quantile sketch (DDSketch-style). Every quantile it returns
+    # is within relative_accuracy of the true value, inserts are vectorized,
+    # and two sketches with the same accuracy merge by adding their bucket
+    # counts, so per-asset sketches combine into fleet answers exactly.
+    def __init__(self, relative_accuracy=0.005):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self._offset = 0
+        self._bins = np.zeros(0, dtype="int64")
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _grow(self, lo, hi):
+        if not len(self._bins):
+            self._offset = lo
+            self._bins = np.zeros(hi - lo + 1, dtype="int64")
+            return
+        new_lo = min(lo, self._offset)
+        new_hi = max(hi, self._offset + len(self._bins) - 1)
+        if new_lo == self._offset and new_hi == self._offset + len(self._bins) - 1:
+            return
+        bins = np.zeros(new_hi - new_lo + 1, dtype="int64")
+        start = self._offset - new_lo
+        bins[start:start + len(self._bins)] = self._bins
+        self._offset, self._bins = new_lo, bins
+
+    def add(self, values):
+        values = np.asarray(values, dtype="float64").ravel()
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return self
+        if (values < 0).any():
+            raise ValueError("QuantileSketch only accepts non-negative values")
+        positive = values[values > 0]
+        self.zero_count += len(values) - len(positive)
+        if len(positive):
+            keys = np.ceil(np.log(positive) / self._log_gamma).astype("int64")
+            lo, hi = int(keys.min()), int(keys.max())
+            self._grow(lo, hi)
+            counts = np.bincount(keys - lo, minlength=hi - lo + 1)
+            start = lo - self._offset
+            self._bins[start:start + len(counts)] += counts
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        return self
+
+    def merge(self, other):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge sketches with different relative accuracy")
+        if len(other._bins):
+            self._grow(other._offset, other._offset + len(other._bins) - 1)
+            start = other._offset - self._offset
+            self._bins[start:start + len(other._bins)] += other._bins
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def copy(self):
+        return QuantileSketch(self.relative_accuracy).merge(self)
+
+    def quantiles(self, qs):
+        qs = np.atleast_1d(np.asarray(qs, dtype="float64"))
+        if not self.count:
+            return np.full(len(qs), np.nan)
+        ranks = qs * (self.count - 1)
+        cumulative = self.zero_count + np.cumsum(self._bins)
+        index = np.searchsorted(cumulative, ranks, side="right")
+        index = np.minimum(index, len(self._bins) - 1) if len(self._bins) else index
+        keys = self._offset + index
+        values = 2 * self.gamma ** keys / (self.gamma + 1)
+        values = np.where(ranks < self.zero_count, 0.0, values)
+        # Never report beyond the observed extremes
+        return np.clip(values, self.min, self.max)
+
+    def quantile(self, q):
+        return float(self.quantiles([q])[0])
+
+    @property
+    def nbytes(self):
+        return self._bins.nbytes
@@ -1,6 +1,8 @@
 import streamlit as st
-def apply_custom_style():
-    st.markdown("""
+
+# Built once per process; every rerun re-emits the same bytes, which
+# Streamlit's message cache then sends to the browser as a hash reference
+STYLESHEET = """
     <style>
         .summary-card {background: white; border-radius: 10px; padding: 20px; box-shadow: 0 4px 6px rgba(0,0,0,0.05); margin-bottom: 20px;}
         .metric-value {font-size: 2.2rem; font-weight: 700; text-align: center; color: #1e3a8a;}
@@ -10,6 +12,22 @@ def apply_custom_style():
         .normal {color: #10b981 !important;}
         .section-title {color: #1e3a8a; border-bottom: 2px solid #dbeafe; padding-bottom: 8px; margin-top: 25px;}
         
+        /* Card grids rendered by components.cards */
+        .card-grid {display: grid; grid-template-columns: repeat(var(--columns, 4), minmax(0, 1fr)); gap: 1rem; margin-bottom: 20px;}
+        .card-grid .summary-card {margin-bottom: 0;}
+        .card-heading {font-size: 1.2rem; text-align: center; font-weight: bold; margin-bottom: 15px;}
+        .card-title {text-align: center; font-weight: bold; margin-bottom: 15px;}
+        .card-row {display: flex; justify-content: space-between; margin-bottom: 10px;}
+        .card-row span:last-child {font-weight: bold;}
+        .card-target {text-align: center; margin-top: 10px;}
+        .card-delta {text-align: center; font-size: 0.85rem;}
+        .card-metrics {display: flex; justify-content: space-around; margin-bottom: 20px;}
+        .card-table {width: 100%; border-collapse: collapse;}
+        .card-table th, .card-table td {border: none; padding: 0 0 10px 0; text-align: right;}
+        .card-table th {color: #4b5563; font-weight: normal;}
+        .card-table td {font-weight: bold;}
+        .card-table th:first-child, .card-table td:first-child {text-align: left; font-weight: normal; width: 50%;}
+        
         /* Add table styling */
         .alert-table {
             width: 100%;
@@ -38,4 +56,7 @@ def apply_custom_style():
             font-weight: bold;
         }
     </style>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    """
+
+def apply_custom_style():
+    st.markdown(STYLESHEET, unsafe_allow_html=True)
@@ -0,0 +1,19 @@
+import streamlit as st
+from components import data, summary_cards, telemetry, alert_rules, anomalies, rollups
+from utils import coalesce
+
+coalesce.checkpoint()
+equipment_df = data.load_data()[0]
+readings, _ = data.load_energy_intervals()
+
+# Critical Alerts
+st.markdown('<p class="section-title">Critical Alerts & Action Items</p>', unsafe_allow_html=True)
+active_alerts = alert_rules.evaluate(telemetry.ingest_synthetic())
+summary_cards.display_alerts_table(active_alerts)
+
+# Performance Summary
+st.markdown('<p class="section-title">Performance Summary</p>', unsafe_allow_html=True)
+coalesce.checkpoint()
+kpi_comparisons = rollups.comparisons(equipment_df, data.load_maintenance_history(), readings)
+positive_trends, watch_areas = anomalies.performance_highlights(equipment_df, readings, active_alerts, kpi_comparisons)
+summary_cards.display_performance_summary(positive_trends, watch_areas)
@@ -0,0 +1,44 @@
+import streamlit as st
+from components import data, charts, summary_cards, live_charts, tariff, distributions, exports, forecasting
+from utils import coalesce, config
+
+live_mode = st.session_state.get("live_mode", False)
+
+@st.fragment(run_every=config.LIVE_REFRESH_SECONDS if live_mode else None)
+def energy_consumption_section():
+    coalesce.checkpoint()
+    if live_mode:
+        chart = live_charts.live_energy_consumption_chart(data.load_data()[2])
+    else:
+        chart = charts.create_energy_consumption_chart(
+            data.load_data()[2], forecasting.energy_forecast(*data.load_energy_intervals())
+        )
+    st.plotly_chart(chart, use_container_width=True)
+
+coalesce.checkpoint()
+equipment_df, _, energy_df = data.load_data()
+readings, meters = data.load_energy_intervals()
+
+# Fold any new days into the quantile sketches
+distributions.update_from_data(equipment_df, readings)
+percentiles = distributions.fleet_percentiles()
+
+# Energy Consumption
+st.markdown('<p class="section-title">Energy Consumption</p>', unsafe_allow_html=True)
+col1, col2 = st.columns([1, 1])
+with col1:
+    energy_consumption_section()
+    summary_cards.display_distribution_summary(percentiles)
+with col2:
+    coalesce.checkpoint()
+    gauge_chart = charts.create_energy_gauge(energy_df, percentiles["fleet_daily_kwh"])
+    st.plotly_chart(gauge_chart, use_container_width=True)
+    summary_cards.display_energy_summary(
+        energy_df, tariff.recent_cost_summary(readings, meters), forecasting.energy_forecast(readings, meters)
+    )
+
+# Downloads for the selected date range and sites
+start, end, sites = exports.selected_filters()
+with st.expander("Download data"):
+    exports.download_buttons("Daily energy", "energy_daily", lambda: exports.daily_export(energy_df, start, end))
+    exports.download_buttons("Meter intervals", "meter_intervals", lambda: exports.interval_export(readings, meters, start, end, sites))
@@ -0,0 +1,27 @@
+import streamlit as st
+from components import data, status_cards, charts, live_charts, telemetry, exports
+from utils import coalesce, config
+
+live_mode = st.session_state.get("live_mode", False)
+
+@st.fragment(run_every=config.LIVE_REFRESH_SECONDS if live_mode else None)
+def equipment_uptime_section():
+    coalesce.checkpoint()
+    if live_mode:
+        chart = live_charts.live_equipment_uptime_chart(data.load_data()[0])
+    else:
+        chart = charts.create_equipment_uptime_chart(data.load_data()[0])
+    st.plotly_chart(chart, use_container_width=True)
+
+# Live sensor readings from the in-memory telemetry buffers
+st.subheader("Live Sensor Readings")
+status_cards.display_sensor_cards(telemetry.ingest_synthetic())
+
+# Equipment Uptime Trends
+st.markdown('<p class="section-title">Equipment Uptime Trends</p>', unsafe_allow_html=True)
+equipment_uptime_section()
+
+# Downloads for the selected date range
+start, end, _ = exports.selected_filters()
+with st.expander("Download data"):
+    exports.download_buttons("Equipment uptime", "equipment_uptime", lambda: exports.daily_export(data.load_data()[0], start, end))
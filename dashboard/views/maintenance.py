@@ -0,0 +1,36 @@
+import streamlit as st
+from components import data, charts, summary_cards, reliability, exports
+from utils import coalesce
+
+coalesce.checkpoint()
+maintenance_df = data.load_data()[1]
+
+# Maintenance Metrics
+st.markdown('<p class="section-title">Maintenance Operations</p>', unsafe_allow_html=True)
+col1, col2 = st.columns([2, 1])
+with col1:
+    maintenance_chart = charts.create_maintenance_chart(maintenance_df)
+    st.plotly_chart(maintenance_chart, use_container_width=True)
+with col2:
+    summary_cards.display_maintenance_summary(maintenance_df)
+
+# Reliability over the full work-order history for the selected sites and
+# asset types; status is left open since MTTR needs both ends of an order
+coalesce.checkpoint()
+events = data.load_work_order_events()
+filters = exports.work_order_filters()
+events = data.work_order_index(events).select(events, site=filters["site"], asset_type=filters["asset_type"])
+reliability_stats = reliability.compute_reliability(events)
+if reliability_stats is not None:
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        summary_cards.display_reliability_summary(reliability_stats)
+    with col2:
+        backlog_chart = charts.create_backlog_age_chart(reliability_stats["backlog"])
+        st.plotly_chart(backlog_chart, use_container_width=True)
+
+# Downloads for the selected date range and sites
+start, end, sites = exports.selected_filters()
+with st.expander("Download data"):
+    exports.download_buttons("Daily maintenance", "maintenance_daily", lambda: exports.daily_export(data.load_maintenance_history(), start, end))
+    exports.download_buttons("Work-order events", "work_order_events", lambda: exports.work_order_export(data.load_work_order_events(), start, end, filters))
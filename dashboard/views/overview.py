@@ -0,0 +1,22 @@
+import streamlit as st
+from components import data, status_cards, summary_cards, tariff, rollups
+from utils import coalesce
+
+# Headline KPIs only; every figure here is a cached aggregate the warm-up
+# precomputes, so this page never builds a chart
+coalesce.checkpoint()
+equipment_df, maintenance_df, energy_df = data.load_data()
+readings, meters = data.load_energy_intervals()
+kpi_comparisons = rollups.comparisons(equipment_df, data.load_maintenance_history(), readings)
+
+# Current status indicators
+st.subheader("Current Operational Status")
+status_cards.display_status_cards(equipment_df, maintenance_df, energy_df, rollups.status_deltas(kpi_comparisons))
+
+col1, col2 = st.columns([1, 1])
+with col1:
+    st.markdown('<p class="section-title">Maintenance</p>', unsafe_allow_html=True)
+    summary_cards.display_maintenance_summary(maintenance_df)
+with col2:
+    st.markdown('<p class="section-title">Energy</p>', unsafe_allow_html=True)
+    summary_cards.display_energy_summary(energy_df, tariff.recent_cost_summary(readings, meters))
@@ -0,0 +1,58 @@
+import argparse
+import logging
+import time
+
+from components import charts, data, distributions, forecasting, kpis, reliability, rollups, tariff
+from utils import artifacts, config
+from utils.cache import CACHE
+
+logger = logging.getLogger("texo.warmup")
+
+
+def build_default_views(equipment_df, maintenance_df, energy_df, snapshot_dir=None):
+    # Everything the first page needs for the default 7-day range, called
+    # with the same arguments as the views so the cache keys match
+    charts.create_equipment_uptime_chart(equipment_df)
+    charts.create_maintenance_chart(maintenance_df)
+    kpis.compute_kpis(equipment_df, maintenance_df, energy_df)
+    readings, meters = data.load_energy_intervals(snapshot_dir)
+    distributions.update_from_data(equipment_df, readings)
+    charts.create_energy_gauge(energy_df, distributions.fleet_percentiles()["fleet_daily_kwh"])
+    charts.create_energy_consumption_chart(energy_df, forecasting.energy_forecast(readings, meters))
+    tariff.recent_cost_summary(readings, meters)
+    rollups.comparisons(equipment_df, data.load_maintenance_history(), readings)
+    events = data.load_work_order_events()
+    data.work_order_index(events)
+    reliability_stats = reliability.compute_reliability(events)
+    if reliability_stats is not None:
+        charts.create_backlog_age_chart(reliability_stats["backlog"])
+
+
+def warm_cache(directory=None, snapshot_dir=None):
+    started = time.perf_counter()
+    # Only entries for the version being warmed belong in its artifact file
+    CACHE.clear()
+    equipment_df, maintenance_df, energy_df = data.load_data(snapshot_dir)
+    version = data.data_version(equipment_df)
+    build_default_views(equipment_df, maintenance_df, energy_df, snapshot_dir)
+
+    path = artifacts.save_artifacts(version, dict(CACHE.items()), directory)
+    logger.info(
+        "warmed %d artifacts for %s in %.2fs -> %s",
+        CACHE.stats()["entries"], version, time.perf_counter() - started, path,
+    )
+    return version
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute dashboard artifacts before the server takes traffic")
+    parser.add_argument("--dir", default=config.ARTIFACT_DIR, help="on-disk artifact cache directory")
+    parser.add_argument("--snapshot-dir", default=None, help="snapshot directory (default TEXO_SNAPSHOT_DIR)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    warm_cache(args.dir, args.snapshot_dir)
+
+
+if __name__ == "__main__":
+    main()
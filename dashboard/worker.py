@@ -0,0 +1,51 @@
+import argparse
+import logging
+import time
+
+import warmup
+from components import data, snapshot
+from utils import config
+
+logger = logging.getLogger("texo.worker")
+
+
+def refresh_once(directory, warm=True):
+    frames = dict(zip(data.FRAME_NAMES, data.load_source_data()))
+    readings, meters = data.load_source_intervals()
+    frames["energy_intervals"] = readings.reset_index()
+    frames["meters"] = meters
+    version = snapshot.publish_snapshot(directory, frames, keep=config.SNAPSHOTS_TO_KEEP)
+    logger.info("published snapshot %s to %s", version, directory)
+    if warm:
+        warmup.warm_cache(snapshot_dir=directory)
+    return version
+
+
+def run(directory, interval, warm=True):
+    while True:
+        started = time.monotonic()
+        try:
+            refresh_once(directory, warm)
+        except Exception:
+            # A failed refresh leaves the previous snapshot in place for viewers
+            logger.exception("snapshot refresh failed")
+        time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh dashboard data and publish Arrow snapshots")
+    parser.add_argument("--dir", default=config.SNAPSHOT_DIR, help="snapshot directory shared with the dashboard")
+    parser.add_argument("--interval", type=int, default=config.REFRESH_INTERVAL_SECONDS, help="seconds between refreshes")
+    parser.add_argument("--once", action="store_true", help="publish a single snapshot and exit")
+    parser.add_argument("--no-warm", dest="warm", action="store_false", help="skip precomputing artifacts for each snapshot")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    if args.once:
+        refresh_once(args.dir, args.warm)
+    else:
+        run(args.dir, args.interval, args.warm)
+
+
+if __name__ == "__main__":
+    main()